@@ -5,6 +5,7 @@ from __future__ import annotations
 __all__ = ["Backend"]
 
 import abc
+import asyncio
 from datetime import datetime
 from typing import List, Optional
 
@@ -89,6 +90,25 @@ class Backend(abc.ABC):
         """
         ...
 
+    async def enqueue_many(self, tasks: List[Task]) -> None:
+        """
+        Persist several new tasks.
+
+        The default implementation enqueues tasks one at a time; backends that
+        support it should override this to write all tasks in one transaction.
+
+        Args:
+            tasks: The task objects to persist.
+
+        Returns:
+            None
+
+        Raises:
+            BackendError: If the tasks cannot be persisted.
+        """
+        for task in tasks:
+            await self.enqueue(task)
+
     @abc.abstractmethod
     async def reserve(self, max_items: int, now: datetime) -> List[ReservedTask]:
         """
@@ -157,6 +177,58 @@ class Backend(abc.ABC):
         """
         ...
 
+    async def wait_for_result(
+        self,
+        task_id: str,
+        timeout: Optional[float] = None,
+        poll_interval: float = 0.5,
+    ) -> Optional[Result]:
+        """
+        Wait until ``task_id`` has a result, or ``timeout`` seconds pass.
+
+        The default implementation polls ``get_result``; backends that can
+        observe completions should override this to wake up immediately.
+
+        Args:
+            task_id: The ID of the task to wait for.
+            timeout: Maximum seconds to wait. ``None`` waits indefinitely.
+            poll_interval: Seconds between ``get_result`` checks.
+
+        Returns:
+            The Result object, or None if the timeout expired first.
+
+        Raises:
+            BackendError: If retrieval fails.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            result = await self.get_result(task_id)
+            if result is not None:
+                return result
+            delay = poll_interval
+            if deadline is not None:
+                delay = min(delay, deadline - loop.time())
+                if delay <= 0:
+                    return None
+            await asyncio.sleep(delay)
+
+    async def wait_for_new_task(self, timeout: float) -> None:
+        """
+        Block an idle worker until new work may be available.
+
+        Returns after ``timeout`` seconds at the latest. The default
+        implementation simply sleeps; backends that can observe enqueues
+        should override this to return as soon as a task is added.
+
+        Args:
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            None
+        """
+        await asyncio.sleep(timeout)
+
     # ------------------------------------------------------------------
     # Legacy compatibility methods (can be implemented using new methods)
     # ------------------------------------------------------------------
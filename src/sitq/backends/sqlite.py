@@ -4,12 +4,16 @@ SQLite‑based backend using SQLAlchemy async engine.
 
 from __future__ import annotations
 
+import asyncio
 import json
+import sqlite3
+import threading
 import uuid
-from datetime import datetime, timedelta
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 import sqlalchemy as sa
+from loguru import logger
 from sqlalchemy import (
     Table,
     Column,
@@ -24,15 +28,34 @@ from sqlalchemy import (
     text,
 )
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncConnection, AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 
 from ..core import Task, Result, _now
+from ..exceptions import ValidationError
 from .base import Backend
 
+# UPDATE ... RETURNING is available from SQLite 3.35
+_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
 
 class SQLiteBackend(Backend):
     """SQLite implementation – suitable for local development or testing."""
 
-    def __init__(self, db_path: str = "sqlite+aiosqlite:///pytaskqueue.db"):
+    #: PRAGMAs applied to every new connection unless overridden.
+    DEFAULT_PRAGMAS: Dict[str, Any] = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+    }
+
+    def __init__(
+        self,
+        db_path: str = "sqlite+aiosqlite:///pytaskqueue.db",
+        *,
+        pragmas: Optional[Dict[str, Any]] = None,
+        pool_size: Optional[int] = None,
+        max_overflow: Optional[int] = None,
+    ):
         """
         Initialize a SQLiteBackend instance.
 
@@ -40,9 +63,69 @@ class SQLiteBackend(Backend):
             db_path: Database connection string or file path. Defaults to
                 "sqlite+aiosqlite:///pytaskqueue.db". If a relative file path is
                 provided, it will be converted to the appropriate SQLite URI format.
+            pragmas: Optional PRAGMA overrides merged over ``DEFAULT_PRAGMAS``,
+                e.g. ``{"synchronous": "OFF", "temp_store": "MEMORY"}`` for
+                throwaway test databases.
+            pool_size: Number of aiosqlite connections kept open in the engine's
+                pool for file databases. Defaults to SQLAlchemy's pool size.
+            max_overflow: Extra connections allowed beyond ``pool_size`` under
+                load; these are closed again when returned.
+
+        Raises:
+            ValidationError: If a PRAGMA name is not a valid identifier, a
+                PRAGMA value is neither an int nor an identifier string, or a
+                pool setting is given for an in-memory database.
         """
         self.db_path = self._gen_db_uri(db_path)
+        self.pragmas: Dict[str, Any] = {**self.DEFAULT_PRAGMAS, **(pragmas or {})}
+        for name, value in self.pragmas.items():
+            if not name.isidentifier():
+                raise ValidationError(
+                    f"Invalid SQLite PRAGMA name: {name!r}",
+                    parameter="pragmas",
+                    value=name,
+                )
+            # Values are interpolated into SQL, so only allow plain tokens
+            if not (
+                isinstance(value, int)
+                or (isinstance(value, str) and value.isidentifier())
+            ):
+                raise ValidationError(
+                    f"Invalid value for SQLite PRAGMA {name}: {value!r}",
+                    parameter="pragmas",
+                    value=value,
+                )
+        self._engine_kwargs: Dict[str, Any] = {}
+        if self.is_memory:
+            # In-memory databases live only as long as their connection, so
+            # every session must share one.
+            self._engine_kwargs["poolclass"] = StaticPool
+        for name, value in (("pool_size", pool_size), ("max_overflow", max_overflow)):
+            if value is None:
+                continue
+            if self.is_memory:
+                raise ValidationError(
+                    f"{name} is not supported for in-memory databases",
+                    parameter=name,
+                    value=value,
+                )
+            self._engine_kwargs[name] = value
+            # SQLAlchemy < 2.0.38 defaults file databases to NullPool, which
+            # rejects pool sizing, so ask for a queue pool explicitly
+            self._engine_kwargs["poolclass"] = AsyncAdaptedQueuePool
         self.engine: Optional[AsyncEngine] = None
+        # Futures of wait_for_result() callers, keyed by task id
+        self._result_waiters: Dict[str, Set[asyncio.Future]] = {}
+        # Futures of idle workers in wait_for_new_task()
+        self._task_waiters: Set[asyncio.Future] = set()
+        # Guards both waiter collections; callers and workers may run on
+        # different threads' event loops
+        self._waiters_lock = threading.Lock()
+        # Earliest future next_run_time seen by this instance, so idle workers
+        # only query the database when it is unknown or has come due
+        self._next_eta: Optional[datetime] = None
+        self._next_eta_known = False
+        self._next_eta_lock = threading.Lock()
         self._tasks: Optional[Table] = None
         self._results: Optional[Table] = None
 
@@ -52,38 +135,47 @@ class SQLiteBackend(Backend):
     async def connect(self):
         """
         Create an async engine and configure SQLite pragmas for cross-process use
-        (WAL mode and a reasonable busy timeout). We run synchronous PRAGMA
-        statements via AsyncConnection.run_sync before creating tables.
+        (WAL mode and a reasonable busy timeout by default). PRAGMAs such as
+        ``synchronous`` are per-connection, so they are applied from a
+        ``connect`` event hook to every connection the pool opens.
         """
-        self.engine = create_async_engine(self.db_path, echo=False, future=True)
+        self.engine = create_async_engine(
+            self.db_path, echo=False, future=True, **self._engine_kwargs
+        )
+        sa.event.listen(self.engine.sync_engine, "connect", self._configure_pragma)
         async with self.engine.begin() as conn:
-            # Configure PRAGMAs for better concurrency between processes, then
-            # create tables if they don't exist.
-            await conn.run_sync(self._configure_pragma)
+            # Create tables if they don't exist.
             await conn.run_sync(self._create_tables)
 
             # Ensure schema is up-to-date (migrations)
             await self._ensure_schema(conn)
 
-    def _configure_pragma(self, sync_conn):
+    def _configure_pragma(self, dbapi_connection, connection_record):
         """
-        Configure SQLite PRAGMA settings on the synchronous connection provided
-        by AsyncConnection.run_sync. Enabling WAL mode and a longer busy timeout
-        improves visibility and reduces locking issues when multiple processes
-        use the same SQLite file.
+        Apply ``self.pragmas`` to a freshly opened DBAPI connection. Enabling
+        WAL mode and a longer busy timeout improves visibility and reduces
+        locking issues when multiple processes use the same SQLite file.
         """
+        cursor = dbapi_connection.cursor()
         try:
-            sync_conn.execute(sa.text("PRAGMA journal_mode=WAL"))
-            sync_conn.execute(sa.text("PRAGMA synchronous=NORMAL"))
-            sync_conn.execute(sa.text("PRAGMA busy_timeout=5000"))
-        except Exception:
-            # Non-fatal: if pragmas fail, proceed; table creation will still run.
-            pass
+            for name, value in self.pragmas.items():
+                try:
+                    cursor.execute(f"PRAGMA {name}={value}")
+                except Exception as e:
+                    # Non-fatal: if a pragma fails, proceed with the others.
+                    logger.warning(f"Failed to apply SQLite PRAGMA {name}={value}: {e}")
+        finally:
+            cursor.close()
 
     async def close(self):
         if self.engine:
             await self.engine.dispose()
 
+    @property
+    def is_memory(self) -> bool:
+        """Whether the database is in-memory (``:memory:`` or ``mode=memory``)."""
+        return ":memory:" in self.db_path or "mode=memory" in self.db_path
+
     @staticmethod
     def _gen_db_uri(db_path: str) -> str:
         """Generate the database URI for SQLite."""
@@ -93,8 +185,6 @@ class SQLiteBackend(Backend):
 
     # ------------------------------------------------------------------
     def _create_tables(self, sync_conn):
-        from loguru import logger
-
         logger.debug(f"_create_tables arg type: {type(sync_conn)}")
 
         # Build a fresh MetaData for the synchronous DDL operation
@@ -146,7 +236,6 @@ class SQLiteBackend(Backend):
 
     async def _ensure_schema(self, conn: AsyncConnection) -> None:
         """Ensure database schema is up-to-date, running migrations if needed."""
-        from loguru import logger
         from sqlalchemy import text
 
         # Check if error column exists in results table using PRAGMA
@@ -179,6 +268,16 @@ class SQLiteBackend(Backend):
         except Exception as e:
             logger.warning(f"Error checking schema: {e}")
 
+        # Partial index over unfinished tasks so reserve() seeks instead of
+        # scanning rows that already have a result. IF NOT EXISTS also covers
+        # databases created before the index was introduced.
+        await conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS tasks_pending_idx "
+                "ON tasks (next_run_time) WHERE result_id IS NULL"
+            )
+        )
+
     # ------------------------------------------------------------------
     # Core operations
     # ------------------------------------------------------------------
@@ -196,23 +295,53 @@ class SQLiteBackend(Backend):
         Raises:
             BackendError: If the database operation fails.
         """
-        stmt = self._tasks.insert().values(
-            id=task.id,
-            func=task.func,
-            args=task.args,
-            kwargs=task.kwargs,
-            context=task.context,
-            schedule=json.dumps(task.schedule) if task.schedule else None,
-            created_at=task.created_at,
-            next_run_time=task.available_at,
-            last_run_time=task.last_run_time,
-            result_id=task.result_id,
-            retries=task.retries,
-            max_retries=task.max_retries,
-            locked_until=None,
-        )
+        stmt = self._tasks.insert().values(**self._task_row(task))
         async with self.engine.begin() as conn:
             await conn.execute(stmt)
+        self._notify_new_task([task])
+
+    async def enqueue_many(self, tasks: List[Task]) -> None:
+        """
+        Enqueue several tasks in a single transaction.
+
+        All rows are written with one executemany INSERT and committed once,
+        instead of paying a transaction (and fsync) per task.
+
+        Args:
+            tasks: The Task objects to enqueue.
+
+        Returns:
+            None
+
+        Raises:
+            BackendError: If the database operation fails.
+        """
+        if not tasks:
+            return
+
+        rows = [self._task_row(task) for task in tasks]
+        async with self.engine.begin() as conn:
+            await conn.execute(self._tasks.insert(), rows)
+        self._notify_new_task(tasks)
+
+    @staticmethod
+    def _task_row(task: Task) -> dict:
+        """Map a Task onto the column values of the tasks table."""
+        return {
+            "id": task.id,
+            "func": task.func,
+            "args": task.args,
+            "kwargs": task.kwargs,
+            "context": task.context,
+            "schedule": json.dumps(task.schedule) if task.schedule else None,
+            "created_at": task.created_at,
+            "next_run_time": task.available_at,
+            "last_run_time": task.last_run_time,
+            "result_id": task.result_id,
+            "retries": task.retries,
+            "max_retries": task.max_retries,
+            "locked_until": None,
+        }
 
     async def fetch_due_tasks(self, limit: int = 1) -> List[Task]:
         """
@@ -282,6 +411,8 @@ class SQLiteBackend(Backend):
             await conn.execute(
                 self._tasks.update().where(self._tasks.c.id == task_id).values(**kwargs)
             )
+        if "next_run_time" in kwargs:
+            self._record_eta(kwargs["next_run_time"])
 
     async def store_result(self, result: Result) -> None:
         """
@@ -314,17 +445,16 @@ class SQLiteBackend(Backend):
         a task reaches a terminal state. This avoids returning intermediate
         attempt rows from the immutable results table.
         """
-        # First fetch the result_id referenced by the task (short-lived connection)
-        stmt_task = select(self._tasks.c.result_id).where(self._tasks.c.id == task_id)
-        async with self.engine.connect() as conn:
-            task_res = await conn.execute(stmt_task)
-            task_row = task_res.fetchone()
-
-        if not task_row or not task_row.result_id:
-            return None
-
-        # Fetch the referenced result row
-        stmt = select(self._results).where(self._results.c.id == task_row.result_id)
+        # Follow the task's result_id to its result row in a single query
+        stmt = (
+            select(self._results)
+            .select_from(
+                self._tasks.join(
+                    self._results, self._results.c.id == self._tasks.c.result_id
+                )
+            )
+            .where(self._tasks.c.id == task_id)
+        )
         async with self.engine.connect() as conn:
             result = await conn.execute(stmt)
             row = result.fetchone()
@@ -348,6 +478,144 @@ class SQLiteBackend(Backend):
 
         return Result(**result_kwargs)
 
+    async def wait_for_result(
+        self,
+        task_id: str,
+        timeout: Optional[float] = None,
+        poll_interval: float = 0.5,
+    ) -> Optional[Result]:
+        """
+        Wait until ``task_id`` has a result, or ``timeout`` seconds pass.
+
+        Completions recorded through this backend instance (``mark_success`` /
+        ``mark_failure``) wake the waiter immediately, even from a worker on
+        another thread's event loop. Polling every ``poll_interval`` seconds
+        remains as a backstop for workers in other processes.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            # Register before checking so a completion in between is not missed
+            waiter = loop.create_future()
+            with self._waiters_lock:
+                self._result_waiters.setdefault(task_id, set()).add(waiter)
+            try:
+                result = await self.get_result(task_id)
+                if result is not None:
+                    return result
+                delay = poll_interval
+                if deadline is not None:
+                    delay = min(delay, deadline - loop.time())
+                    if delay <= 0:
+                        return None
+                await asyncio.wait({waiter}, timeout=delay)
+            finally:
+                with self._waiters_lock:
+                    waiters = self._result_waiters.get(task_id)
+                    if waiters is not None:
+                        waiters.discard(waiter)
+                        if not waiters:
+                            self._result_waiters.pop(task_id, None)
+
+    async def wait_for_new_task(self, timeout: float) -> None:
+        """
+        Sleep for up to ``timeout`` seconds, waking early on a local enqueue.
+
+        Tasks enqueued through this backend instance wake idle workers at once,
+        even from a queue on another thread's event loop. The wait is also cut
+        short at the earliest future ``next_run_time`` of an unfinished task,
+        so delayed tasks wake workers when they come due. That ETA is cached:
+        the database is only queried on the first wait and after the cached
+        ETA has passed, so ETAs set by other processes are picked up then or
+        when the timeout expires.
+        """
+        # Register before querying so an enqueue in between is not missed
+        waiter = asyncio.get_running_loop().create_future()
+        with self._waiters_lock:
+            self._task_waiters.add(waiter)
+        try:
+            now = _now()
+            next_eta = await self._earliest_eta(now)
+            if next_eta is not None:
+                until_eta = (next_eta - now).total_seconds()
+                timeout = max(0.0, min(timeout, until_eta))
+            await asyncio.wait({waiter}, timeout=timeout)
+        finally:
+            with self._waiters_lock:
+                self._task_waiters.discard(waiter)
+
+    async def _earliest_eta(self, now: datetime) -> Optional[datetime]:
+        """Return the earliest future ``next_run_time``, querying only if needed.
+
+        A failed query is logged and treated as "no known ETA", so the caller
+        falls back to its plain timeout.
+        """
+        with self._next_eta_lock:
+            if self._next_eta_known and (
+                self._next_eta is None or self._next_eta > now
+            ):
+                return self._next_eta
+            # Record ETAs that arrive while the query runs from scratch
+            self._next_eta = None
+            self._next_eta_known = False
+
+        try:
+            async with self.engine.connect() as conn:
+                next_eta = await conn.scalar(
+                    select(sa.func.min(self._tasks.c.next_run_time)).where(
+                        (self._tasks.c.next_run_time > now)
+                        & (self._tasks.c.result_id.is_(None))
+                    )
+                )
+        except Exception as e:
+            logger.warning(f"Failed to look up the next task ETA: {e}")
+            return None
+
+        if next_eta is not None:
+            # SQLite returns the stored UTC timestamps as naive datetimes
+            next_eta = next_eta.replace(tzinfo=timezone.utc)
+        with self._next_eta_lock:
+            if next_eta is not None and (
+                self._next_eta is None or next_eta < self._next_eta
+            ):
+                self._next_eta = next_eta
+            self._next_eta_known = True
+            return self._next_eta
+
+    def _record_eta(self, eta: Optional[datetime]) -> None:
+        """Lower the cached earliest ETA to a future ``eta`` if it is sooner."""
+        # Naive datetimes cannot be compared with the UTC clock
+        if eta is None or eta.tzinfo is None or eta <= _now():
+            return
+        with self._next_eta_lock:
+            if self._next_eta is None or eta < self._next_eta:
+                self._next_eta = eta
+
+    def _notify_new_task(self, tasks: Iterable[Task]) -> None:
+        """Record the ETAs of enqueued ``tasks`` and wake idle workers."""
+        for task in tasks:
+            self._record_eta(task.available_at)
+
+        with self._waiters_lock:
+            waiters = list(self._task_waiters)
+        for waiter in waiters:
+            try:
+                waiter.get_loop().call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:
+                # The waiter's event loop has already been closed
+                pass
+
+    def _notify_result(self, task_id: str) -> None:
+        """Wake every wait_for_result() caller waiting on ``task_id``."""
+        with self._waiters_lock:
+            waiters = list(self._result_waiters.pop(task_id, ()))
+        for waiter in waiters:
+            try:
+                waiter.get_loop().call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:
+                # The waiter's event loop has already been closed
+                pass
+
     # ------------------------------------------------------------------
     # Locking / retry helpers
     # ------------------------------------------------------------------
@@ -420,6 +688,7 @@ class SQLiteBackend(Backend):
                     locked_until=None,
                 )
             )
+        self._record_eta(retry_time)
 
     # ------------------------------------------------------------------
     # New abstract method implementations
@@ -440,8 +709,8 @@ class SQLiteBackend(Backend):
         # Find and lock available tasks
         lock_until = now + timedelta(seconds=30)  # 30 second lock
 
-        stmt = (
-            select(self._tasks)
+        candidates = (
+            select(self._tasks.c.id)
             .where(
                 (
                     (self._tasks.c.next_run_time <= now)
@@ -457,21 +726,49 @@ class SQLiteBackend(Backend):
             .limit(max_items)
         )
 
-        async with self.engine.begin() as conn:
-            # First, fetch candidate tasks
-            result = await conn.execute(stmt)
-            rows = result.fetchall()
-
-            if not rows:
-                return []
-
-            # Then, lock them atomically
-            task_ids = [row.id for row in rows]
-            await conn.execute(
+        if _SUPPORTS_RETURNING:
+            # Select and lock in one statement, so concurrent callers can
+            # never claim the same task
+            stmt = (
                 self._tasks.update()
-                .where(self._tasks.c.id.in_(task_ids))
+                .where(self._tasks.c.id.in_(candidates))
                 .values(locked_until=lock_until)
+                .returning(
+                    self._tasks.c.id,
+                    self._tasks.c.func,
+                    self._tasks.c.context,
+                    self._tasks.c.next_run_time,
+                )
+            )
+            async with self.engine.begin() as conn:
+                result = await conn.execute(stmt)
+                rows = result.fetchall()
+
+            # RETURNING yields rows in no particular order; NULLs sort first,
+            # as they do in the candidate query
+            rows.sort(
+                key=lambda row: (row.next_run_time is not None, row.next_run_time)
             )
+        else:
+            async with self.engine.begin() as conn:
+                # First, fetch candidate tasks
+                result = await conn.execute(
+                    select(self._tasks)
+                    .where(self._tasks.c.id.in_(candidates))
+                    .order_by(self._tasks.c.next_run_time)
+                )
+                rows = result.fetchall()
+
+                if not rows:
+                    return []
+
+                # Then, lock them atomically
+                task_ids = [row.id for row in rows]
+                await conn.execute(
+                    self._tasks.update()
+                    .where(self._tasks.c.id.in_(task_ids))
+                    .values(locked_until=lock_until)
+                )
 
         # Convert to ReservedTask objects
         reserved_tasks = []
@@ -525,6 +822,8 @@ class SQLiteBackend(Backend):
                 )
             )
 
+        self._notify_result(task_id)
+
     async def mark_failure(self, task_id: str, error: str, traceback: str) -> None:
         """
         Mark a task as failed.
@@ -587,3 +886,10 @@ class SQLiteBackend(Backend):
                     locked_until=None,
                 )
             )
+
+        self._notify_result(task_id)
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
@@ -4,9 +4,8 @@ from __future__ import annotations
 
 __all__ = ["TaskQueue"]
 
-import asyncio
 from datetime import datetime
-from typing import Optional, Any
+from typing import Any, Callable, Iterable, List, Optional
 
 from .serialization import Serializer, CloudpickleSerializer
 from .core import Task, Result, _now
@@ -117,6 +116,71 @@ class TaskQueue:
             TaskQueueError: If task enqueue fails.
             SerializationError: If task serialization fails.
         """
+        task = self._create_task(func, args, kwargs, eta)
+
+        # Persist task
+        try:
+            await self.backend.enqueue(task)
+        except Exception as e:
+            raise TaskQueueError(
+                "Failed to enqueue task in backend",
+                task_id=task.id,
+                cause=e,
+            ) from e
+
+        return task.id
+
+    async def enqueue_many(
+        self,
+        specs: Iterable[tuple[Callable[..., Any], tuple, dict[str, Any]]],
+        eta: Optional[datetime] = None,
+    ) -> List[str]:
+        """Enqueue several tasks in one backend write.
+
+        Each spec is validated and serialized exactly like ``enqueue``; the
+        resulting tasks are then handed to the backend together so backends
+        that support batching persist them in a single transaction.
+
+        Args:
+            specs: ``(func, args, kwargs)`` tuples, one per task.
+            eta: Optional UTC datetime for delayed execution of all tasks.
+
+        Returns:
+            Task IDs, in the same order as ``specs``.
+
+        Raises:
+            ValidationError: If any func is not callable or eta is invalid.
+            TaskQueueError: If the batch enqueue fails.
+            SerializationError: If task serialization fails.
+
+        Example:
+            >>> task_ids = await queue.enqueue_many(
+            ...     [(my_function, (i,), {}) for i in range(10)]
+            ... )
+        """
+        tasks = [
+            self._create_task(func, args, kwargs, eta) for func, args, kwargs in specs
+        ]
+
+        # Persist tasks
+        try:
+            await self.backend.enqueue_many(tasks)
+        except Exception as e:
+            raise TaskQueueError(
+                f"Failed to enqueue {len(tasks)} tasks in backend",
+                cause=e,
+            ) from e
+
+        return [task.id for task in tasks]
+
+    def _create_task(
+        self,
+        func: Callable[..., Any],
+        args: tuple,
+        kwargs: dict[str, Any],
+        eta: Optional[datetime],
+    ) -> Task:
+        """Validate inputs and build a Task with a serialized envelope."""
         # Input validation
         validate(func, "func").is_required().is_callable().validate()
 
@@ -139,20 +203,7 @@ class TaskQueue:
         # Determine available_at timestamp
         available_at = eta if eta else _now()
 
-        # Create task
-        task = Task(func=serialized_envelope, available_at=available_at)
-
-        # Persist task
-        try:
-            await self.backend.enqueue(task)
-        except Exception as e:
-            raise TaskQueueError(
-                "Failed to enqueue task in backend",
-                task_id=task.id,
-                cause=e,
-            ) from e
-
-        return task.id
+        return Task(func=serialized_envelope, available_at=available_at)
 
     async def get_result(
         self, task_id: str, timeout: Optional[int] = None
@@ -175,24 +226,16 @@ class TaskQueue:
         if timeout is not None:
             validate(timeout, "timeout").is_non_negative().validate()
 
-        start = _now()
-
-        while True:
-            try:
-                result = await self.backend.get_result(task_id)
-                if result:
-                    return result
-
-                if timeout is not None and (_now() - start).total_seconds() > timeout:
-                    return None
-
-                await asyncio.sleep(0.5)
-            except Exception as e:
-                raise TaskQueueError(
-                    f"Failed to get result for task {task_id}",
-                    task_id=task_id,
-                    cause=e,
-                ) from e
+        try:
+            # Backends wake this as soon as a local worker records the
+            # result, falling back to polling for out-of-process workers
+            return await self.backend.wait_for_result(task_id, timeout=timeout)
+        except Exception as e:
+            raise TaskQueueError(
+                f"Failed to get result for task {task_id}",
+                task_id=task_id,
+                cause=e,
+            ) from e
 
     def deserialize_result(self, result: Result) -> Any:
         """Deserialize the result value from a Result object.
@@ -5,6 +5,7 @@ from __future__ import annotations
 __all__ = ["Worker"]
 
 import asyncio
+import threading
 import traceback
 from datetime import datetime, timezone
 from typing import Optional
@@ -37,6 +38,11 @@ class Worker:
         max_concurrency: Maximum number of concurrent tasks.
         poll_interval: Seconds between polling attempts.
         _running: Whether the worker is currently running.
+        ready_event: Thread-safe event set once the polling loop has begun, for
+            callers that run the worker on another thread's event loop.
+        _started: Event set once the polling loop has begun.
+        _idle: Event set while nothing is in flight and the last poll was empty.
+        _run_task: Background task running start() when used as a context manager.
 
     Example:
         >>> backend = SQLiteBackend("tasks.db")
@@ -90,9 +96,55 @@ class Worker:
 
         # Runtime state
         self._running = False
+        self._started = asyncio.Event()
+        self.ready_event = threading.Event()
         self._shutdown_event = asyncio.Event()
         self._semaphore = asyncio.Semaphore(max_concurrency)
         self._tasks: set[asyncio.Task] = set()
+        self._idle = asyncio.Event()
+        self._queue_empty = False
+        self._run_task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "Worker":
+        """Start the worker in the background and wait until it is polling.
+
+        Returns:
+            Worker: The running worker instance.
+
+        Raises:
+            RuntimeError: If the worker is already running.
+            BackendError: If backend connection fails.
+
+        Example:
+            >>> async with Worker(backend, max_concurrency=4) as worker:
+            ...     task_id = await queue.enqueue(my_function)
+            ...     await worker.drain()
+        """
+        if self._started.is_set() or self._run_task is not None:
+            raise RuntimeError("Worker already running")
+        self._run_task = asyncio.create_task(self.start())
+        started = asyncio.create_task(self._started.wait())
+        await asyncio.wait(
+            {self._run_task, started}, return_when=asyncio.FIRST_COMPLETED
+        )
+        if not started.done():
+            # start() returned before polling began; surface its error
+            started.cancel()
+            await self._run_task
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Stop the worker and wait for its polling loop to finish.
+
+        Args:
+            exc_type: Exception type if an exception occurred.
+            exc: Exception instance if an exception occurred.
+            tb: Traceback if an exception occurred.
+        """
+        await self.stop()
+        if self._run_task is not None:
+            run_task, self._run_task = self._run_task, None
+            await run_task
 
     async def start(self) -> None:
         """Start the worker and begin processing tasks.
@@ -121,17 +173,25 @@ class Worker:
 
         self._running = True
         self._shutdown_event.clear()
+        self._idle.clear()
+        self._queue_empty = False
 
         # Connect to backend if needed
         await self.backend.connect()
 
         try:
+            self._started.set()
+            self.ready_event.set()
             await self._polling_loop()
         except Exception as e:
             logger.error("Worker polling loop failed: %s", e, exc_info=True)
             raise
         finally:
             self._running = False
+            self._started.clear()
+            self.ready_event.clear()
+            # Never leave drain() waiters blocked on a stopped worker
+            self._idle.set()
             logger.info("Worker stopped")
 
     async def stop(self) -> None:
@@ -162,6 +222,20 @@ class Worker:
         await self.backend.close()
         logger.info("Worker stopped gracefully")
 
+    async def drain(self) -> None:
+        """Wait until the worker has run out of work.
+
+        Resolves once no tasks are in flight and the most recent poll found
+        no ready tasks in the backend, or once the worker stops. Tasks with
+        a future ETA do not count as pending work.
+
+        Example:
+            >>> worker_task = asyncio.create_task(worker.start())
+            >>> await worker.drain()  # All currently ready tasks are done
+            >>> await worker.stop()
+        """
+        await self._idle.wait()
+
     async def _polling_loop(self) -> None:
         """Main polling loop for reserving and executing tasks."""
         while not self._shutdown_event.is_set():
@@ -174,22 +248,46 @@ class Worker:
 
                 if reserved_tasks:
                     logger.debug("Reserved %d tasks for execution", len(reserved_tasks))
+                    self._queue_empty = False
+                    self._idle.clear()
 
                     # Execute each reserved task (dispatches with semaphore protection)
                     for reserved_task in reserved_tasks:
                         self._dispatch_task(reserved_task)
                 else:
-                    # No tasks available, wait for poll interval
+                    self._queue_empty = True
+                    if not self._tasks:
+                        self._idle.set()
+
+                    # No tasks available; wait for an enqueue or the poll interval
                     logger.debug(
-                        "No tasks available, waiting %.1fs", self.poll_interval
+                        "No tasks available, waiting up to %.1fs", self.poll_interval
                     )
-                    await asyncio.sleep(self.poll_interval)
+                    await self._wait_for_work()
 
             except Exception as e:
                 logger.error("Error in polling loop: %s", e, exc_info=True)
                 # Wait a bit before retrying
                 await asyncio.sleep(min(self.poll_interval, 1.0))
 
+    async def _wait_for_work(self) -> None:
+        """Wait until a task is enqueued, poll_interval elapses, or stop() is called."""
+        new_task = asyncio.ensure_future(
+            self.backend.wait_for_new_task(self.poll_interval)
+        )
+        shutdown = asyncio.ensure_future(self._shutdown_event.wait())
+        try:
+            await asyncio.wait(
+                {new_task, shutdown}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if new_task.done() and new_task.exception() is not None:
+                # Fall back to a plain poll_interval wait instead of spinning
+                logger.warning(f"Waiting for new tasks failed: {new_task.exception()}")
+                await asyncio.wait({shutdown}, timeout=self.poll_interval)
+        finally:
+            new_task.cancel()
+            shutdown.cancel()
+
     def _dispatch_task(self, reserved_task: ReservedTask) -> None:
         """Dispatch a reserved task with semaphore protection and tracking.
 
@@ -209,7 +307,13 @@ class Worker:
 
         task = asyncio.create_task(_run_with_semaphore())
         self._tasks.add(task)
-        task.add_done_callback(self._tasks.discard)
+        task.add_done_callback(self._on_task_done)
+
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        """Stop tracking a finished task and flag the worker idle if drained."""
+        self._tasks.discard(task)
+        if not self._tasks and self._queue_empty:
+            self._idle.set()
 
     async def _execute_task(self, reserved_task: ReservedTask) -> None:
         """Execute a single reserved task."""
@@ -308,5 +412,5 @@ class Worker:
         """Track a task and remove it from the set when done."""
         task = asyncio.create_task(coro)
         self._tasks.add(task)
-        task.add_done_callback(self._tasks.discard)
+        task.add_done_callback(self._on_task_done)
         return task
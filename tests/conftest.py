@@ -0,0 +1,23 @@
+"""Shared pytest configuration for the sitq test suite."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make ``import sitq`` resolve to the in-tree sources. Done once here rather
+# than per test module, and only if an editable install hasn't already put
+# ``src`` on the path.
+_SRC = str(Path(__file__).resolve().parent.parent / "src")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip ``performance`` tests unless they are selected with ``-m``."""
+    if "performance" in (config.getoption("markexpr") or ""):
+        return
+    skip_performance = pytest.mark.skip(reason="run with -m performance")
+    for item in items:
+        if "performance" in item.keywords:
+            item.add_marker(skip_performance)
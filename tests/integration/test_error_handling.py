@@ -143,7 +143,6 @@ class TestValidation:
 class TestRetryLogic:
     """Test retry logic for transient failures."""
 
-    @pytest.mark.asyncio
     async def test_retry_async_success_on_first_attempt(self):
         """Test retry decorator succeeds on first attempt."""
         mock_func = AsyncMock(return_value="success")
@@ -156,7 +155,6 @@ class TestRetryLogic:
         assert result == "success"
         assert mock_func.call_count == 1
 
-    @pytest.mark.asyncio
     async def test_retry_async_eventual_success(self):
         """Test retry decorator succeeds after retries."""
         mock_func = AsyncMock(
@@ -175,7 +173,6 @@ class TestRetryLogic:
         assert result == "success"
         assert mock_func.call_count == 3
 
-    @pytest.mark.asyncio
     async def test_retry_async_max_attempts_exceeded(self):
         """Test retry decorator fails after max attempts."""
         mock_func = AsyncMock(side_effect=ConnectionError("Always fails"))
@@ -188,7 +185,6 @@ class TestRetryLogic:
             await test_func()
         assert mock_func.call_count == 2
 
-    @pytest.mark.asyncio
     async def test_retry_async_non_retryable_exception(self):
         """Test retry decorator doesn't retry non-retryable exceptions."""
         mock_func = AsyncMock(side_effect=ValueError("Non-retryable"))
@@ -235,7 +231,6 @@ class TestRetryLogic:
 class TestTaskQueueErrorHandling:
     """Test error handling in TaskQueue."""
 
-    @pytest.mark.asyncio
     async def test_task_queue_enqueue_validation_error(self):
         """Test TaskQueue enqueue with invalid input."""
         backend = Mock()
@@ -247,7 +242,6 @@ class TestTaskQueueErrorHandling:
         with pytest.raises(ValidationError):
             await task_queue.enqueue("not_a_function")
 
-    @pytest.mark.asyncio
     async def test_task_queue_enqueue_backend_error_wrapping(self):
         """Test TaskQueue wraps backend errors properly."""
         backend = Mock()
@@ -261,7 +255,6 @@ class TestTaskQueueErrorHandling:
         assert "Failed to enqueue task in backend" in str(exc_info.value)
         assert exc_info.value.cause is not None
 
-    @pytest.mark.asyncio
     async def test_task_queue_get_result_timeout(self):
         """Test TaskQueue get_result timeout handling."""
         backend = Mock()
@@ -276,7 +269,6 @@ class TestTaskQueueErrorHandling:
 class TestWorkerErrorHandling:
     """Test error handling in Worker."""
 
-    @pytest.mark.asyncio
     async def test_worker_task_execution_error_wrapping(self):
         """Test Worker wraps task execution errors properly."""
         backend = Mock()
@@ -289,7 +281,6 @@ class TestWorkerErrorHandling:
         with pytest.raises(ValidationError):
             Worker(None)  # Invalid backend
 
-    @pytest.mark.asyncio
     async def test_worker_serialization_error_handling(self):
         """Test Worker handles serialization errors properly."""
         backend = Mock()
@@ -348,7 +339,6 @@ class TestSQLiteBackendErrorHandling:
             backend = SQLiteBackend("")
             backend._get_connection()  # This would trigger validation
 
-    @pytest.mark.asyncio
     async def test_sqlite_backend_connection_error_wrapping(self):
         """Test SQLite backend wraps connection errors properly."""
         backend = SQLiteBackend("/invalid/path/test.db")
@@ -360,7 +350,6 @@ class TestSQLiteBackendErrorHandling:
             assert "Failed to connect to SQLite database" in str(exc_info.value)
             assert exc_info.value.backend_type == "sqlite"
 
-    @pytest.mark.asyncio
     async def test_sqlite_backend_enqueue_validation(self):
         """Test SQLite backend enqueue validation."""
         backend = SQLiteBackend(":memory:")
@@ -415,7 +404,6 @@ class TestSerializationErrorHandling:
 class TestErrorPropagation:
     """Test error propagation across components."""
 
-    @pytest.mark.asyncio
     async def test_error_propagation_from_backend_to_queue(self):
         """Test errors propagate correctly from backend to queue."""
         backend = Mock()
@@ -432,7 +420,6 @@ class TestErrorPropagation:
         assert exc_info.value.cause is not None
         assert isinstance(exc_info.value.cause, BackendError)
 
-    @pytest.mark.asyncio
     async def test_error_propagation_from_serialization_to_queue(self):
         """Test errors propagate correctly from serialization to queue."""
         backend = Mock()
@@ -36,11 +36,9 @@ def sample_task():
     )
 
 
-@pytest.mark.asyncio
 class TestInMemoryDatabase:
     """Test cases for in-memory SQLite database."""
 
-    @pytest.mark.asyncio
     async def test_shared_connection_persistence(self, memory_backend, sample_task):
         """Test that data persists across different operations using shared connection."""
         # Enqueue a task
@@ -53,7 +51,6 @@ class TestInMemoryDatabase:
         assert len(reserved_tasks) == 1
         assert reserved_tasks[0].task_id == sample_task.task_id
 
-    @pytest.mark.asyncio
     async def test_multiple_operations_same_connection(self, memory_backend):
         """Test multiple operations work correctly with the same shared connection."""
         # Create multiple tasks
@@ -91,7 +88,6 @@ class TestInMemoryDatabase:
                 reserved_ids.append(task.task_id)
         assert len(set(reserved_ids)) == 5
 
-    @pytest.mark.asyncio
     async def test_concurrent_operations_shared_connection(
         self, memory_backend, sample_task
     ):
@@ -131,7 +127,6 @@ class TestInMemoryDatabase:
                 all_task_ids.append(task.task_id)
         assert len(set(all_task_ids)) == 10
 
-    @pytest.mark.asyncio
     async def test_task_lifecycle_shared_connection(self, memory_backend, sample_task):
         """Test complete task lifecycle using shared connection."""
         # Enqueue
@@ -158,7 +153,6 @@ class TestInMemoryDatabase:
             pending_tasks.append(task)
         assert len(pending_tasks) == 0
 
-    @pytest.mark.asyncio
     async def test_error_handling_shared_connection(self, memory_backend, sample_task):
         """Test error handling with shared connection."""
         # Enqueue and reserve
@@ -179,7 +173,6 @@ class TestInMemoryDatabase:
         assert result.error == error_msg
         assert result.traceback == traceback
 
-    @pytest.mark.asyncio
     async def test_connection_cleanup(self, memory_backend):
         """Test that connection is properly cleaned up."""
         # Verify shared connection exists
@@ -207,7 +200,6 @@ class TestInMemoryDatabase:
         # Verify connection is cleaned up
         assert memory_backend._shared_connection is None
 
-    @pytest.mark.asyncio
     async def test_statistics_with_shared_connection(self, memory_backend):
         """Test queue statistics work correctly with shared connection."""
         # Create tasks with different outcomes
@@ -248,7 +240,6 @@ class TestInMemoryDatabase:
         assert stats["completed"] >= 1
         assert stats["failed"] >= 1
 
-    @pytest.mark.asyncio
     async def test_retry_logic_shared_connection(self, memory_backend):
         """Test retry logic works correctly with shared connection."""
         # Create a task that will be retried
@@ -289,7 +280,6 @@ class TestInMemoryDatabase:
         retry_task_ids = [t.task_id for t in pending_tasks if t.task_id == task.task_id]
         assert len(retry_task_ids) == 0  # Should not be available yet
 
-    @pytest.mark.asyncio
     async def test_eta_scheduling_shared_connection(self, memory_backend):
         """Test ETA-based scheduling works with shared connection."""
         future_time = datetime.now(timezone.utc) + timedelta(hours=1)
@@ -321,7 +311,6 @@ class TestInMemoryDatabase:
         eta_task_ids = [t.task_id for t in pending_tasks if t.task_id == task.task_id]
         assert len(eta_task_ids) == 1
 
-    @pytest.mark.asyncio
     async def test_expiration_shared_connection(self, memory_backend):
         """Test task expiration works with shared connection."""
         past_time = datetime.now(timezone.utc) - timedelta(hours=1)
@@ -21,20 +21,20 @@ def test_sync_queue_with_worker():
             print("✓ SyncTaskQueue started")
 
             # Start a worker in background
-            worker = Worker(backend, max_concurrency=1, poll_interval=0.1)
+            worker = Worker(backend, max_concurrency=1, poll_interval=1.0)
 
             import asyncio
             import threading
 
-            def run_worker():
-                asyncio.run(worker.start())
-
-            worker_thread = threading.Thread(target=run_worker, daemon=True)
+            worker_loop = asyncio.new_event_loop()
+            worker_thread = threading.Thread(
+                target=worker_loop.run_forever, daemon=True
+            )
             worker_thread.start()
+            worker_run = asyncio.run_coroutine_threadsafe(worker.start(), worker_loop)
 
             try:
-                # Give worker time to start
-                time.sleep(0.5)
+                assert worker.ready_event.wait(timeout=2.0), "Worker did not start"
 
                 # Test enqueue and get_result
                 def test_task():
@@ -59,14 +59,14 @@ def test_sync_queue_with_worker():
                 print("✗ Task did not complete within timeout")
 
             finally:
-                # Stop worker by creating a new event loop
-                stop_loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(stop_loop)
-                try:
-                    stop_loop.run_until_complete(worker.stop())
-                finally:
-                    stop_loop.close()
+                # Stop worker on the loop it runs on
+                asyncio.run_coroutine_threadsafe(worker.stop(), worker_loop).result(
+                    timeout=5.0
+                )
+                worker_run.result(timeout=5.0)
+                worker_loop.call_soon_threadsafe(worker_loop.stop)
                 worker_thread.join(timeout=5.0)
+                worker_loop.close()
                 print("✓ Worker stopped")
 
 
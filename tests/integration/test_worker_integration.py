@@ -1,7 +1,7 @@
 """Integration tests for Worker implementation."""
 
 import asyncio
-import tempfile
+import re
 import time
 import uuid
 from datetime import datetime, timezone, timedelta
@@ -11,21 +11,100 @@ import pytest
 
 from src.sitq.backends.sqlite import SQLiteBackend
 from src.sitq.core import Task
+from src.sitq.queue import TaskQueue
 from src.sitq.worker import Worker
 from src.sitq.serialization import CloudpickleSerializer
 
 
+# Final "ExcType: message" line of a formatted traceback
+TRACEBACK_EXCEPTION = re.compile(r"^(\w+): ", re.MULTILINE)
+
+
+def sync_error():
+    raise ValueError("Sync error")
+
+
+async def async_error():
+    await asyncio.sleep(0)
+    raise RuntimeError("Async error")
+
+
+def divide_by_zero():
+    return 1 / 0
+
+
+def simple_task():
+    return "task_completed"
+
+
+async def async_task():
+    await asyncio.sleep(0)  # Exercise the async path without latency
+    return "async_completed"
+
+
+def failing_task():
+    raise ValueError("Test error message")
+
+
+def eta_task():
+    return "eta_completed"
+
+
+async def slow_task():
+    await asyncio.sleep(0.05)
+    return "slow_completed"
+
+
+async def long_task():
+    await asyncio.sleep(2.0)
+    return "long_completed"
+
+
+@pytest.fixture(scope="module")
+async def running_worker(tmp_path_factory):
+    """Start one worker shared by every test in this module that requests it."""
+    db_path = tmp_path_factory.mktemp("sitq") / "worker.db"
+    backend = SQLiteBackend(str(db_path))
+    await backend.connect()
+    queue = TaskQueue(backend)
+
+    async with Worker(backend, max_concurrency=3, poll_interval=0.05):
+        yield queue
+
+
+@pytest.mark.parametrize(
+    "func,expected_type,expected_error",
+    [
+        (sync_error, "ValueError", "Sync error"),
+        (async_error, "RuntimeError", "Async error"),
+        (divide_by_zero, "ZeroDivisionError", "division by zero"),
+    ],
+    ids=["sync", "async", "zero-division"],
+)
+async def test_worker_failure_handling(
+    running_worker, func, expected_type, expected_error
+):
+    """Test that sync, async and builtin failures are recorded with tracebacks."""
+    task_id = await running_worker.enqueue(func)
+
+    result = await running_worker.get_result(task_id, timeout=5)
+
+    assert result is not None
+    assert result.status == "failed"
+    assert expected_error in result.error
+    assert TRACEBACK_EXCEPTION.findall(result.traceback)[-1] == expected_type
+
+
 class TestWorkerIntegration:
     """Integration tests for Worker."""
 
     @pytest.fixture
-    async def backend(self):
+    async def backend(self, tmp_path):
         """Create a temporary SQLite backend for testing."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-            backend = SQLiteBackend(tmp.name)
-            await backend.connect()
-            yield backend
-            await backend.close()
+        backend = SQLiteBackend(str(tmp_path / "tasks.db"))
+        await backend.connect()
+        yield backend
+        await backend.close()
 
     @pytest.fixture
     def serializer(self):
@@ -42,17 +121,13 @@ class TestWorkerIntegration:
             poll_interval=0.1,  # Fast polling for tests
         )
 
-    @pytest.mark.asyncio
     async def test_basic_task_execution(self, backend, serializer):
         """Test basic task execution through worker."""
 
         # Create a simple task
-        def simple_task():
-            return "task_completed"
-
         task = Task(
             id=str(uuid.uuid4()),
-            func=serializer.dumps(simple_task),
+            func=serializer.serialize_task_envelope(simple_task),
             created_at=datetime.now(timezone.utc),
         )
 
@@ -85,17 +160,12 @@ class TestWorkerIntegration:
             await worker.stop()
             await worker_task
 
-    @pytest.mark.asyncio
     async def test_async_task_execution(self, backend, serializer):
         """Test execution of async tasks."""
 
-        async def async_task():
-            await asyncio.sleep(0.1)  # Simulate async work
-            return "async_completed"
-
         task = Task(
             id=str(uuid.uuid4()),
-            func=serializer.dumps(async_task),
+            func=serializer.serialize_task_envelope(async_task),
             created_at=datetime.now(timezone.utc),
         )
 
@@ -122,16 +192,12 @@ class TestWorkerIntegration:
             await worker.stop()
             await worker_task
 
-    @pytest.mark.asyncio
     async def test_task_failure_handling(self, backend, serializer):
         """Test that task failures are properly recorded."""
 
-        def failing_task():
-            raise ValueError("Test error message")
-
         task = Task(
             id=str(uuid.uuid4()),
-            func=serializer.dumps(failing_task),
+            func=serializer.serialize_task_envelope(failing_task),
             created_at=datetime.now(timezone.utc),
         )
 
@@ -158,18 +224,14 @@ class TestWorkerIntegration:
             await worker.stop()
             await worker_task
 
-    @pytest.mark.asyncio
     async def test_eta_scheduling(self, backend, serializer):
         """Test that tasks with future ETA are not executed early."""
 
-        def eta_task():
-            return "eta_completed"
-
         # Create task with future ETA
         future_time = datetime.now(timezone.utc) + timedelta(seconds=2)
         task = Task(
             id=str(uuid.uuid4()),
-            func=serializer.dumps(eta_task),
+            func=serializer.serialize_task_envelope(eta_task),
             created_at=datetime.now(timezone.utc),
             available_at=future_time,
         )
@@ -206,20 +268,15 @@ class TestWorkerIntegration:
             await worker.stop()
             await worker_task
 
-    @pytest.mark.asyncio
     async def test_concurrency_control(self, backend, serializer):
         """Test that worker respects concurrency limits."""
 
-        async def slow_task():
-            await asyncio.sleep(0.5)
-            return "slow_completed"
-
         # Create multiple tasks
         tasks = []
         for i in range(3):
             task = Task(
                 id=str(uuid.uuid4()),
-                func=serializer.dumps(slow_task),
+                func=serializer.serialize_task_envelope(slow_task),
                 created_at=datetime.now(timezone.utc),
             )
             tasks.append(task)
@@ -230,43 +287,26 @@ class TestWorkerIntegration:
         worker_task = asyncio.create_task(worker.start())
 
         try:
-            # Wait a bit for tasks to start
-            await asyncio.sleep(0.2)
+            # Wait for every task to finish instead of sleeping for a guess
+            await asyncio.wait_for(worker.drain(), timeout=10.0)
 
-            # Check that only 2 tasks are in-flight at any time
-            # This is hard to test directly, but we can verify completion order
-            completed_tasks = []
-            timeout = 10.0
-            start_time = time.time()
-
-            while time.time() - start_time < timeout and len(completed_tasks) < 3:
-                for task in tasks:
-                    if task.id not in completed_tasks:
-                        result = await backend.get_result(task.id)
-                        if result and result.status == "success":
-                            completed_tasks.append(task.id)
-                            completed_result = serializer.loads(result.value)
-                            assert completed_result == "slow_completed"
-                await asyncio.sleep(0.1)
-
-            assert len(completed_tasks) == 3
+            for task in tasks:
+                result = await backend.get_result(task.id)
+                assert result is not None
+                assert result.status == "success"
+                assert serializer.loads(result.value) == "slow_completed"
 
         finally:
             await worker.stop()
             await worker_task
 
-    @pytest.mark.asyncio
     async def test_graceful_shutdown(self, backend, serializer):
         """Test graceful shutdown with in-flight tasks."""
 
-        async def long_task():
-            await asyncio.sleep(2.0)
-            return "long_completed"
-
         # Create a long-running task
         task = Task(
             id=str(uuid.uuid4()),
-            func=serializer.dumps(long_task),
+            func=serializer.serialize_task_envelope(long_task),
             created_at=datetime.now(timezone.utc),
         )
 
@@ -301,7 +341,6 @@ class TestWorkerIntegration:
             except asyncio.CancelledError:
                 pass  # Expected during shutdown
 
-    @pytest.mark.asyncio
     async def test_multiple_workers(self, backend, serializer):
         """Test multiple workers sharing the same backend."""
 
@@ -317,7 +356,7 @@ class TestWorkerIntegration:
 
             task = Task(
                 id=str(uuid.uuid4()),
-                func=serializer.dumps(make_task),
+                func=serializer.serialize_task_envelope(make_task),
                 created_at=datetime.now(timezone.utc),
             )
             tasks.append(task)
@@ -0,0 +1,68 @@
+"""Throughput stress test for the Worker draining a large batch of tasks."""
+
+import time
+
+import pytest
+import sqlalchemy as sa
+
+from sitq import SQLiteBackend, TaskQueue, Worker
+
+# Minimum sustained tasks/sec across enqueue + execution. Kept well below
+# what a local SQLite file achieves so the check only trips on real
+# regressions, not on a slow CI box.
+MIN_TASKS_PER_SECOND = 400
+
+# reserve() locks tasks for 30s and the worker reserves ahead of its
+# semaphore, so a run slower than that could execute tasks twice. Every
+# case must fit in half the lock window even at the minimum rate.
+RESERVE_LOCK_SECONDS = 30
+TASK_COUNTS = [1_000, 5_000]
+assert max(TASK_COUNTS) / MIN_TASKS_PER_SECOND <= RESERVE_LOCK_SECONDS / 2
+
+
+def noop():
+    return None
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("num_tasks", TASK_COUNTS)
+async def test_worker_high_throughput(tmp_path, num_tasks):
+    """Enqueue a batch in one call and drain it with a highly concurrent worker."""
+    # A small pool beats one connection per task: SQLite serialises writers
+    backend = SQLiteBackend(
+        str(tmp_path / "throughput.db"), pool_size=2, max_overflow=6
+    )
+    await backend.connect()
+    queue = TaskQueue(backend)
+
+    start = time.perf_counter()
+    task_ids = await queue.enqueue_many([(noop, (), {})] * num_tasks)
+
+    async with Worker(backend, max_concurrency=32, poll_interval=0.01) as worker:
+        await worker.drain()
+    elapsed = time.perf_counter() - start
+
+    assert len(task_ids) == num_tasks
+    # The worker closed the backend on exit; reopen to check that every task
+    # ran exactly once and succeeded
+    await backend.connect()
+    try:
+        results = backend._results
+        stmt = sa.select(
+            results.c.task_id,
+            sa.func.count(),
+            sa.func.sum(sa.cast(results.c.status == "success", sa.Integer)),
+        ).group_by(results.c.task_id)
+        async with backend.engine.connect() as conn:
+            counts = {
+                task_id: (total, succeeded)
+                for task_id, total, succeeded in await conn.execute(stmt)
+            }
+    finally:
+        await backend.close()
+
+    assert counts == {task_id: (1, 1) for task_id in task_ids}
+
+    assert elapsed < num_tasks / MIN_TASKS_PER_SECOND, (
+        f"{num_tasks} tasks took {elapsed:.2f}s ({num_tasks / elapsed:.0f} tasks/sec)"
+    )
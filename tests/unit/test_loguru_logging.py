@@ -1,74 +1,55 @@
 """Test logging behavior with loguru replacement."""
 
+import asyncio
 import tempfile
-import threading
-import time
-from io import StringIO
+from collections import deque
 
 from src.sitq.backends.sqlite import SQLiteBackend
 from src.sitq.worker import Worker
 
 
-def test_worker_logging_output():
+async def test_worker_logging_output():
     """Test that worker logging works with loguru and produces expected output."""
     # Create backend
     with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
         backend = SQLiteBackend(tmp.name)
 
-        # Capture log output
-        log_capture = StringIO()
+        # Capture log records in a bounded ring buffer
+        records = deque(maxlen=1000)
 
         # Import loguru and add capture handler
         from loguru import logger
 
         logger.remove()  # Remove default handler
         logger.add(
-            log_capture,
+            lambda msg: records.append(
+                (msg.record["level"].name, msg.record["message"])
+            ),
             level="DEBUG",
-            format="{time} | {level} | {name}:{function}:{line} - {message}",
+            format="{message}",
         )
 
         # Create worker
         worker = Worker(backend, max_concurrency=1, poll_interval=0.1)
 
-        def run_worker():
-            import asyncio
-
-            asyncio.run(worker.start())
-
-        # Start worker in background
-        worker_thread = threading.Thread(target=run_worker, daemon=True)
-        worker_thread.start()
+        # Run worker and stop it on the same event loop
+        worker_task = asyncio.create_task(worker.start())
 
         try:
-            # Give worker time to start
-            time.sleep(0.5)
-
-            # Stop worker to trigger lifecycle logging
-            import asyncio
-
-            stop_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(stop_loop)
             try:
-                stop_loop.run_until_complete(worker.stop())
+                await asyncio.wait_for(worker._started.wait(), 1.0)
             finally:
-                stop_loop.close()
-
-            worker_thread.join(timeout=5.0)
-
-            # Check captured log output
-            log_output = log_capture.getvalue()
+                # Stop worker to trigger lifecycle logging
+                await worker.stop()
+                await worker_task
 
             # Verify expected log messages are present
-            assert "Starting worker with" in log_output
-            assert "Worker stopped gracefully" in log_output
-            assert (
-                "Worker stopped" in log_output
-                or "Worker stopped gracefully" in log_output
-            )
+            assert any("Starting worker with" in m for _, m in records)
+            assert any("Worker stopped gracefully" in m for _, m in records)
+            assert any("Worker stopped" in m for _, m in records)
 
             print("✓ Worker logging test passed!")
-            print(f"Log output captured:\n{log_output}")
+            print(f"Log records captured: {len(records)}")
 
         finally:
             # Restore default logger configuration
@@ -80,10 +61,14 @@ def test_logging_levels():
     """Test that different log levels work correctly."""
     from loguru import logger
 
-    # Capture log output
-    log_capture = StringIO()
+    # Capture log records in a bounded ring buffer
+    records = deque(maxlen=1000)
     logger.remove()  # Remove default handler
-    logger.add(log_capture, level="DEBUG", format="{level} | {message}")
+    logger.add(
+        lambda msg: records.append((msg.record["level"].name, msg.record["message"])),
+        level="DEBUG",
+        format="{message}",
+    )
 
     # Test different log levels
     logger.debug("Debug message")
@@ -91,17 +76,15 @@ def test_logging_levels():
     logger.warning("Warning message")
     logger.error("Error message")
 
-    # Check output
-    log_output = log_capture.getvalue()
-
     # Verify all levels are present
-    assert "DEBUG" in log_output
-    assert "INFO" in log_output
-    assert "WARNING" in log_output
-    assert "ERROR" in log_output
+    levels = {level for level, _ in records}
+    assert "DEBUG" in levels
+    assert "INFO" in levels
+    assert "WARNING" in levels
+    assert "ERROR" in levels
 
     print("✓ Logging levels test passed!")
-    print(f"Log output captured:\n{log_output}")
+    print(f"Log records captured: {list(records)}")
 
     # Restore default logger
     logger.remove()
@@ -112,5 +95,11 @@ if __name__ == "__main__":
     print("Testing loguru logging behavior...")
     test_logging_levels()
     print()
-    test_worker_logging_output()
+    # Run on uvloop when it is installed; fall back to the stock loop
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(test_worker_logging_output())
+    else:
+        uvloop.run(test_worker_logging_output())
     print("All logging tests completed!")
@@ -1,66 +1,78 @@
 #!/usr/bin/env python3
 """Test script to verify sitq module structure and docstring coverage."""
 
-import sys
-import os
-import importlib.util
+import ast
+from pathlib import Path
 
+SITQ_INIT = Path(__file__).resolve().parents[2] / "src" / "sitq" / "__init__.py"
 
-def test_module_import():
-    """Test if sitq module can be imported with all expected symbols."""
-
-    print("Testing sitq module import...")
-
-    try:
-        # Change to src directory
-        sys.path.insert(0, "src")
-
-        # Import the module
-        spec = importlib.util.spec_from_file_location("sitq", "src/sitq/__init__.py")
-        sitq = importlib.util.module_from_spec(spec)
-
-        # Check if all expected symbols are available
-        expected_symbols = [
-            "TaskQueue",
-            "Worker",
-            "SyncTaskQueue",
-            "Task",
-            "Result",
-            "ReservedTask",
-            "Backend",
-            "SQLiteBackend",
-            "Serializer",
-            "CloudpickleSerializer",
-            "SitqError",
-            "TaskQueueError",
-            "BackendError",
-            "WorkerError",
-            "ValidationError",
-            "SerializationError",
-            "ConnectionError",
-            "TaskExecutionError",
-            "TimeoutError",
-            "ResourceExhaustionError",
-            "ConfigurationError",
-            "validate",
-            "ValidationBuilder",
-        ]
-
-        missing_symbols = []
-        for symbol in expected_symbols:
-            if not hasattr(sitq, symbol):
-                missing_symbols.append(symbol)
-
-        if missing_symbols:
-            print(f"❌ Missing symbols: {missing_symbols}")
-            return False
-        else:
-            print("✅ All expected symbols are available")
-            return True
 
-    except Exception as e:
-        print(f"❌ Failed to import sitq: {e}")
-        return False
+def _exported_names(init_path: Path) -> set:
+    """Collect names bound at the top level of a module without importing it."""
+    tree = ast.parse(init_path.read_text(encoding="utf-8"))
+    names = set()
+
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom):
+            names.update(alias.asname or alias.name for alias in node.names)
+        elif isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            names.add(node.name)
+        elif isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "__all__"
+            for target in node.targets
+        ):
+            names.update(
+                elt.value
+                for elt in getattr(node.value, "elts", [])
+                if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+            )
+
+    return names
+
+
+def test_module_import():
+    """Test if sitq module exposes all expected symbols.
+
+    The check is static (``ast`` over ``sitq/__init__.py``) so it does not pay
+    for importing the backend, worker and serializer dependencies; the actual
+    import is smoke-tested by ``test_docstring_coverage``.
+    """
+
+    print("Testing sitq module exports...")
+
+    exported = _exported_names(SITQ_INIT)
+
+    # Check if all expected symbols are available
+    expected_symbols = [
+        "TaskQueue",
+        "Worker",
+        "SyncTaskQueue",
+        "Task",
+        "Result",
+        "ReservedTask",
+        "Backend",
+        "SQLiteBackend",
+        "Serializer",
+        "CloudpickleSerializer",
+        "SitqError",
+        "TaskQueueError",
+        "BackendError",
+        "WorkerError",
+        "ValidationError",
+        "SerializationError",
+        "ConnectionError",
+        "TaskExecutionError",
+        "TimeoutError",
+        "ResourceExhaustionError",
+        "ConfigurationError",
+        "validate",
+        "ValidationBuilder",
+    ]
+
+    missing_symbols = [symbol for symbol in expected_symbols if symbol not in exported]
+
+    assert not missing_symbols, f"Missing symbols: {missing_symbols}"
+    print("✅ All expected symbols are available")
 
 
 def test_docstring_coverage():
@@ -68,57 +80,41 @@ def test_docstring_coverage():
 
     print("Testing docstring coverage...")
 
-    try:
-        sys.path.insert(0, "src")
-        import sitq
-
-        # Test key classes have docstrings
-        classes_to_test = [
-            ("TaskQueue", sitq.TaskQueue),
-            ("Worker", sitq.Worker),
-            ("SyncTaskQueue", sitq.SyncTaskQueue),
-            ("SQLiteBackend", sitq.SQLiteBackend),
-            ("CloudpickleSerializer", sitq.CloudpickleSerializer),
-            ("Result", sitq.Result),
-            ("Task", sitq.Task),
-            ("ReservedTask", sitq.ReservedTask),
-        ]
-
-        missing_docs = []
-        for name, cls in classes_to_test:
-            if not cls.__doc__ or not cls.__doc__.strip():
-                missing_docs.append(name)
-            else:
-                print(f"✅ {name} has docstring")
-
-        if missing_docs:
-            print(f"❌ Missing docstrings: {missing_docs}")
-            return False
+    import sitq
+
+    # Test key classes have docstrings
+    classes_to_test = [
+        ("TaskQueue", sitq.TaskQueue),
+        ("Worker", sitq.Worker),
+        ("SyncTaskQueue", sitq.SyncTaskQueue),
+        ("SQLiteBackend", sitq.SQLiteBackend),
+        ("CloudpickleSerializer", sitq.CloudpickleSerializer),
+        ("Result", sitq.Result),
+        ("Task", sitq.Task),
+        ("ReservedTask", sitq.ReservedTask),
+    ]
+
+    missing_docs = []
+    for name, cls in classes_to_test:
+        if not cls.__doc__ or not cls.__doc__.strip():
+            missing_docs.append(name)
         else:
-            print("✅ All key classes have docstrings")
-            return True
+            print(f"✅ {name} has docstring")
 
-    except Exception as e:
-        print(f"❌ Failed to test docstrings: {e}")
-        return False
+    assert not missing_docs, f"Missing docstrings: {missing_docs}"
+    print("✅ All key classes have docstrings")
 
 
 def main():
-    """Run all tests."""
+    """Run all tests; a failed check raises AssertionError."""
 
     print("Running sitq module and docstring verification tests...\n")
 
-    import_test = test_module_import()
-    docstring_test = test_docstring_coverage()
+    test_module_import()
+    test_docstring_coverage()
 
-    if import_test and docstring_test:
-        print("\n✅ All tests passed! sitq module is ready for documentation.")
-        return True
-    else:
-        print("\n❌ Some tests failed. Please fix issues before proceeding.")
-        return False
+    print("\n✅ All tests passed! sitq module is ready for documentation.")
 
 
 if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
+    main()
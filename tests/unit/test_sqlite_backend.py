@@ -1,84 +1,188 @@
 """Tests for SQLite backend implementation."""
 
 import asyncio
-import tempfile
+import dataclasses
 import uuid
 from datetime import datetime, timezone, timedelta
 from typing import Any
 
 import pytest
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from sitq.backends.sqlite import SQLiteBackend
 from sitq.core import Task, Result, ReservedTask
+from sitq.exceptions import ValidationError
+
+
+# Throwaway databases: no fsync, temp tables in RAM, 64 MiB page cache
+TEST_PRAGMAS = {
+    "journal_mode": "MEMORY",
+    "synchronous": "OFF",
+    "temp_store": "MEMORY",
+    "cache_size": -64000,
+    "busy_timeout": 5000,
+}
+
+
+# Shared defaults for test tasks; each test overrides only what it cares about.
+# A fixed created_at keeps tasks deterministic, and its available_at is in
+# the past so tasks are due unless a test says otherwise.
+_BASE_TASK = Task(
+    id="",
+    func=b"test_function",
+    created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    available_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    max_retries=3,
+)
+
+
+def _make_task(**changes) -> Task:
+    """Copy ``_BASE_TASK`` with a fresh id and the given field overrides."""
+    return dataclasses.replace(_BASE_TASK, id=str(uuid.uuid4()), **changes)
+
+
+@pytest.fixture(scope="session")
+async def sqlite_session_backend():
+    """Create one in-memory SQLite backend shared by the whole session.
+
+    A named shared-cache database keeps the data in memory while still letting
+    a second connection (e.g. plain aiosqlite) see the same tables. WAL does
+    not apply to in-memory databases, so durability is switched off instead.
+    """
+    backend = SQLiteBackend(
+        f"file:sitq_test_{uuid.uuid4().hex}?mode=memory&cache=shared&uri=true",
+        pragmas=TEST_PRAGMAS,
+    )
+    await backend.connect()
+    yield backend
+    await backend.close()
 
 
 @pytest.fixture
-async def sqlite_backend():
-    """Create a temporary SQLite backend for testing."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-        backend = SQLiteBackend(tmp.name)
-        await backend.initialize()
-        yield backend
-        # Cleanup is handled by tempfile
+async def sqlite_backend(sqlite_session_backend):
+    """Hand each test the shared backend with its tables emptied."""
+    backend = sqlite_session_backend
+    async with backend.engine.begin() as conn:
+        await conn.execute(backend._results.delete())
+        await conn.execute(backend._tasks.delete())
+    # Forget ETAs cached for tasks of earlier tests
+    backend._next_eta_known = False
+    return backend
 
 
 @pytest.fixture
 def sample_task():
     """Create a sample task for testing."""
-    return Task(
-        task_id=str(uuid.uuid4()),
-        func="test_function",
-        args=[1, 2, 3],
-        kwargs={"key": "value"},
-        created_at=datetime.now(timezone.utc),
-        eta_at=None,
-        expires_at=None,
-        retry_count=0,
-        max_retries=3,
-        context={"worker_id": "test_worker"},
-    )
+    return _make_task(context=b"test_context")
 
 
 class TestSQLiteBackend:
     """Test cases for SQLiteBackend."""
 
-    @pytest.mark.asyncio
-    async def test_initialize(self):
+    async def test_initialize(self, tmp_path):
         """Test database initialization."""
         import aiosqlite
 
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-            backend = SQLiteBackend(tmp.name)
-            await backend.initialize()
+        # On disk so that a separate aiosqlite connection can inspect it
+        db_path = str(tmp_path / "init.db")
+        backend = SQLiteBackend(db_path)
+        await backend.connect()
 
-            # Check that tables were created
-            async with aiosqlite.connect(tmp.name) as db:
-                cursor = await db.execute(
-                    "SELECT name FROM sqlite_master WHERE type='table' AND name='tasks'"
+        # Check that tables were created
+        async with aiosqlite.connect(db_path) as db:
+            cursor = await db.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name='tasks'"
+            )
+            result = await cursor.fetchone()
+            assert result is not None
+            assert result[0] == "tasks"
+
+    async def test_custom_pragmas(self, tmp_path):
+        """Test that PRAGMA overrides are applied to backend connections."""
+        import sqlalchemy as sa
+
+        backend = SQLiteBackend(
+            str(tmp_path / "pragmas.db"),
+            pragmas={"synchronous": "OFF", "temp_store": "MEMORY"},
+        )
+        await backend.connect()
+        try:
+            async with backend.engine.connect() as conn:
+                journal_mode = await conn.execute(sa.text("PRAGMA journal_mode"))
+                synchronous = await conn.execute(sa.text("PRAGMA synchronous"))
+                temp_store = await conn.execute(sa.text("PRAGMA temp_store"))
+
+                assert journal_mode.scalar() == "wal"  # default kept
+                assert synchronous.scalar() == 0  # OFF
+                assert temp_store.scalar() == 2  # MEMORY
+        finally:
+            await backend.close()
+
+    async def test_connection_pool_settings(self, tmp_path):
+        """Test that pool sizing is passed through to the engine."""
+        backend = SQLiteBackend(str(tmp_path / "pool.db"), pool_size=2, max_overflow=6)
+        await backend.connect()
+        try:
+            assert isinstance(backend.engine.pool, AsyncAdaptedQueuePool)
+            assert backend.engine.pool.size() == 2
+            assert backend.engine.pool._max_overflow == 6
+        finally:
+            await backend.close()
+
+    async def test_reserve_uses_pending_index(self, tmp_path):
+        """Test that the due-task lookup in reserve() is served by an index."""
+        import sqlalchemy as sa
+
+        backend = SQLiteBackend(str(tmp_path / "index.db"))
+        await backend.connect()
+        try:
+            async with backend.engine.connect() as conn:
+                plan = await conn.execute(
+                    sa.text(
+                        "EXPLAIN QUERY PLAN SELECT id FROM tasks "
+                        "WHERE result_id IS NULL AND next_run_time <= :now "
+                        "ORDER BY next_run_time"
+                    ),
+                    {"now": "9999-12-31"},
                 )
-                result = await cursor.fetchone()
-                assert result is not None
-                assert result[0] == "tasks"
+                details = " ".join(row[-1] for row in plan.fetchall())
+
+            assert "tasks_pending_idx" in details
+        finally:
+            await backend.close()
 
-    @pytest.mark.asyncio
     async def test_enqueue_task(self, sqlite_backend, sample_task):
         """Test enqueuing a task."""
+        import sqlalchemy as sa
+
         await sqlite_backend.enqueue(sample_task)
 
-        # Verify task was stored
-        async with sqlite_backend._connect() as db:
-            cursor = await db.execute(
-                "SELECT task_id, status, created_at FROM tasks WHERE task_id = ?",
-                (sample_task.task_id,),
+        # Verify task was stored, unlocked and without a result
+        async with sqlite_backend.engine.connect() as conn:
+            result = await conn.execute(
+                sa.text(
+                    "SELECT id, func, result_id, locked_until FROM tasks WHERE id = :id"
+                ),
+                {"id": sample_task.id},
             )
-            result = await cursor.fetchone()
-            assert result is not None
-            assert result[0] == sample_task.task_id
-            assert result[1] == "pending"
-
-    @pytest.mark.asyncio
-    async def test_reserve_tasks(self, sqlite_backend, sample_task):
+            row = result.fetchone()
+            assert row is not None
+            assert row.id == sample_task.id
+            assert row.func == sample_task.func
+            assert row.result_id is None
+            assert row.locked_until is None
+
+    @pytest.mark.parametrize(
+        "supports_returning", [True, False], ids=["returning", "select-update"]
+    )
+    async def test_reserve_tasks(
+        self, sqlite_backend, sample_task, monkeypatch, supports_returning
+    ):
         """Test reserving tasks for execution."""
+        monkeypatch.setattr(
+            "sitq.backends.sqlite._SUPPORTS_RETURNING", supports_returning
+        )
+
         # Enqueue a task
         await sqlite_backend.enqueue(sample_task)
 
@@ -89,27 +193,18 @@ class TestSQLiteBackend:
         assert len(reserved_tasks) == 1
         reserved = reserved_tasks[0]
         assert isinstance(reserved, ReservedTask)
-        assert reserved.task_id == sample_task.task_id
+        assert reserved.task_id == sample_task.id
         assert reserved.func == sample_task.func
         assert reserved.context == sample_task.context
         assert reserved.started_at >= now
 
-    @pytest.mark.asyncio
+        # The task is now locked
+        assert await sqlite_backend.reserve(1, now) == []
+
     async def test_reserve_with_eta(self, sqlite_backend):
         """Test that tasks with future ETA are not reserved."""
         future_time = datetime.now(timezone.utc) + timedelta(hours=1)
-        task = Task(
-            task_id=str(uuid.uuid4()),
-            func="test_function",
-            args=[],
-            kwargs={},
-            created_at=datetime.now(timezone.utc),
-            eta_at=future_time,
-            expires_at=None,
-            retry_count=0,
-            max_retries=3,
-            context={},
-        )
+        task = _make_task(available_at=future_time)
 
         await sqlite_backend.enqueue(task)
 
@@ -118,31 +213,18 @@ class TestSQLiteBackend:
         reserved_tasks = await sqlite_backend.reserve(1, now)
         assert len(reserved_tasks) == 0
 
-    @pytest.mark.asyncio
-    async def test_reserve_expired_tasks(self, sqlite_backend):
-        """Test that expired tasks are not reserved."""
-        past_time = datetime.now(timezone.utc) - timedelta(hours=1)
-        task = Task(
-            task_id=str(uuid.uuid4()),
-            func="test_function",
-            args=[],
-            kwargs={},
-            created_at=datetime.now(timezone.utc),
-            eta_at=None,
-            expires_at=past_time,
-            retry_count=0,
-            max_retries=3,
-            context={},
-        )
-
-        await sqlite_backend.enqueue(task)
+    async def test_reserve_expired_lock(self, sqlite_backend, sample_task):
+        """Test that a task is reserved again once its lock has expired."""
+        await sqlite_backend.enqueue(sample_task)
 
-        # Try to reserve - should not get the expired task
         now = datetime.now(timezone.utc)
-        reserved_tasks = await sqlite_backend.reserve(1, now)
-        assert len(reserved_tasks) == 0
+        assert len(await sqlite_backend.reserve(1, now)) == 1
+
+        # Still locked shortly after, free again once the 30s lock lapses
+        assert await sqlite_backend.reserve(1, now + timedelta(seconds=10)) == []
+        reserved_tasks = await sqlite_backend.reserve(1, now + timedelta(seconds=31))
+        assert [r.task_id for r in reserved_tasks] == [sample_task.id]
 
-    @pytest.mark.asyncio
     async def test_mark_success(self, sqlite_backend, sample_task):
         """Test marking a task as successful."""
         await sqlite_backend.enqueue(sample_task)
@@ -154,16 +236,15 @@ class TestSQLiteBackend:
 
         # Mark as successful
         result_value = b"success_result"
-        await sqlite_backend.mark_success(sample_task.task_id, result_value)
+        await sqlite_backend.mark_success(sample_task.id, result_value)
 
         # Verify the result
-        result = await sqlite_backend.get_result(sample_task.task_id)
+        result = await sqlite_backend.get_result(sample_task.id)
         assert result is not None
         assert result.value == result_value
         assert result.error is None
         assert result.traceback is None
 
-    @pytest.mark.asyncio
     async def test_mark_failure(self, sqlite_backend, sample_task):
         """Test marking a task as failed."""
         await sqlite_backend.enqueue(sample_task)
@@ -176,95 +257,156 @@ class TestSQLiteBackend:
         # Mark as failed
         error_msg = "Test error"
         traceback = "Test traceback"
-        await sqlite_backend.mark_failure(sample_task.task_id, error_msg, traceback)
+        await sqlite_backend.mark_failure(sample_task.id, error_msg, traceback)
 
         # Verify the result
-        result = await sqlite_backend.get_result(sample_task.task_id)
+        result = await sqlite_backend.get_result(sample_task.id)
         assert result is not None
         assert result.value is None
         assert result.error == error_msg
         assert result.traceback == traceback
 
-    @pytest.mark.asyncio
+    async def test_wait_for_result_wakes_on_completion(
+        self, sqlite_backend, sample_task
+    ):
+        """Test that wait_for_result returns as soon as a result is recorded."""
+        await sqlite_backend.enqueue(sample_task)
+        await sqlite_backend.reserve(1, datetime.now(timezone.utc))
+
+        # A long poll interval proves the wake-up comes from mark_success
+        waiter = asyncio.create_task(
+            sqlite_backend.wait_for_result(
+                sample_task.id, timeout=5.0, poll_interval=60
+            )
+        )
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        await sqlite_backend.mark_success(sample_task.id, b"done")
+
+        result = await asyncio.wait_for(waiter, timeout=1.0)
+        assert result is not None
+        assert result.value == b"done"
+        assert sqlite_backend._result_waiters == {}
+
+    async def test_wait_for_result_timeout(self, sqlite_backend, sample_task):
+        """Test that wait_for_result gives up after the timeout."""
+        await sqlite_backend.enqueue(sample_task)
+
+        result = await sqlite_backend.wait_for_result(sample_task.id, timeout=0.05)
+        assert result is None
+
+    async def test_wait_for_new_task_wakes_on_enqueue(
+        self, sqlite_backend, sample_task
+    ):
+        """Test that an enqueue wakes wait_for_new_task before its timeout."""
+        waiter = asyncio.create_task(sqlite_backend.wait_for_new_task(60))
+        await asyncio.sleep(0)
+
+        await sqlite_backend.enqueue(sample_task)
+
+        await asyncio.wait_for(waiter, timeout=1.0)
+
+    async def test_wait_for_new_task_wakes_at_eta(self, sqlite_backend):
+        """Test that wait_for_new_task returns once a local ETA comes due."""
+        eta = datetime.now(timezone.utc) + timedelta(seconds=0.2)
+        await sqlite_backend.enqueue(_make_task(available_at=eta))
+
+        await asyncio.wait_for(sqlite_backend.wait_for_new_task(60), timeout=2.0)
+        assert datetime.now(timezone.utc) >= eta
+
+    async def test_wait_for_new_task_wakes_at_retry(self, sqlite_backend, sample_task):
+        """Test that a retry scheduled without an enqueue still wakes the wait."""
+        await sqlite_backend.enqueue(sample_task)
+        await sqlite_backend.reserve(1, datetime.now(timezone.utc))
+        await sqlite_backend.schedule_retry(sample_task.id, delay=1)
+
+        await asyncio.wait_for(sqlite_backend.wait_for_new_task(60), timeout=3.0)
+
+    async def test_wait_for_new_task_caches_eta(self, sqlite_backend):
+        """Test that repeated idle waits do not query the database again."""
+        import sqlalchemy as sa
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        sync_engine = sqlite_backend.engine.sync_engine
+        sa.event.listen(sync_engine, "before_cursor_execute", record)
+        try:
+            await sqlite_backend.wait_for_new_task(0.01)
+            assert len(statements) == 1  # the first wait looks up the ETA
+            await sqlite_backend.wait_for_new_task(0.01)
+            assert len(statements) == 1
+        finally:
+            sa.event.remove(sync_engine, "before_cursor_execute", record)
+
+    async def test_wait_for_new_task_survives_query_error(
+        self, sqlite_backend, monkeypatch
+    ):
+        """Test that a failed ETA lookup falls back to the plain timeout."""
+
+        class BrokenEngine:
+            def connect(self):
+                raise RuntimeError("database unavailable")
+
+        monkeypatch.setattr(sqlite_backend, "engine", BrokenEngine())
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await sqlite_backend.wait_for_new_task(0.1)
+        assert loop.time() - start >= 0.09
+
     async def test_get_result_not_found(self, sqlite_backend):
         """Test getting result for non-existent task."""
         result = await sqlite_backend.get_result("non_existent_id")
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_get_result_pending_task(self, sqlite_backend, sample_task):
         """Test getting result for pending task."""
         await sqlite_backend.enqueue(sample_task)
 
-        result = await sqlite_backend.get_result(sample_task.task_id)
+        result = await sqlite_backend.get_result(sample_task.id)
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_get_pending_tasks(self, sqlite_backend):
         """Test getting pending tasks."""
-        # Create multiple tasks
+        # Create multiple tasks, plus one that is not due yet
         tasks = []
         for i in range(3):
-            task = Task(
-                task_id=str(uuid.uuid4()),
-                func=f"test_function_{i}",
-                args=[i],
-                kwargs={},
-                created_at=datetime.now(timezone.utc),
-                eta_at=None,
-                expires_at=None,
-                retry_count=0,
-                max_retries=3,
-                context={},
-            )
+            task = _make_task(func=f"test_function_{i}".encode())
             tasks.append(task)
-            await sqlite_backend.enqueue(task)
+        future_time = datetime.now(timezone.utc) + timedelta(hours=1)
+        await sqlite_backend.enqueue_many(
+            [*tasks, _make_task(available_at=future_time)]
+        )
 
-        # Get pending tasks
-        pending_tasks = []
-        async for task in sqlite_backend.get_pending_tasks(limit=5):
-            pending_tasks.append(task)
+        # Reserve everything that is due
+        pending_tasks = await sqlite_backend.reserve(5, datetime.now(timezone.utc))
 
         assert len(pending_tasks) == 3
         task_ids = {task.task_id for task in pending_tasks}
-        expected_ids = {task.task_id for task in tasks}
+        expected_ids = {task.id for task in tasks}
         assert task_ids == expected_ids
 
-    @pytest.mark.asyncio
+    @pytest.mark.xfail(
+        strict=True,
+        raises=(TypeError, AttributeError),
+        reason="Task has no expires_at field and SQLiteBackend has no "
+        "get_expired_tasks() yet",
+    )
     async def test_get_expired_tasks(self, sqlite_backend):
         """Test getting expired tasks."""
         # Create an expired task
         past_time = datetime.now(timezone.utc) - timedelta(hours=1)
-        expired_task = Task(
-            task_id=str(uuid.uuid4()),
-            func="expired_function",
-            args=[],
-            kwargs={},
-            created_at=datetime.now(timezone.utc),
-            eta_at=None,
-            expires_at=past_time,
-            retry_count=0,
-            max_retries=3,
-            context={},
-        )
+        expired_task = _make_task(func=b"expired_function", expires_at=past_time)
 
         # Create a non-expired task
         future_time = datetime.now(timezone.utc) + timedelta(hours=1)
-        valid_task = Task(
-            task_id=str(uuid.uuid4()),
-            func="valid_function",
-            args=[],
-            kwargs={},
-            created_at=datetime.now(timezone.utc),
-            eta_at=None,
-            expires_at=future_time,
-            retry_count=0,
-            max_retries=3,
-            context={},
-        )
+        valid_task = _make_task(func=b"valid_function", expires_at=future_time)
 
-        await sqlite_backend.enqueue(expired_task)
-        await sqlite_backend.enqueue(valid_task)
+        await sqlite_backend.enqueue_many([expired_task, valid_task])
 
         # Get expired tasks
         expired_tasks = []
@@ -273,90 +415,53 @@ class TestSQLiteBackend:
             expired_tasks.append(task)
 
         assert len(expired_tasks) == 1
-        assert expired_tasks[0].task_id == expired_task.task_id
+        assert expired_tasks[0].id == expired_task.id
 
-    @pytest.mark.asyncio
+    @pytest.mark.xfail(
+        strict=True,
+        raises=AttributeError,
+        reason="SQLiteBackend has no delete_task() yet",
+    )
     async def test_delete_task(self, sqlite_backend, sample_task):
         """Test deleting a task."""
+        import sqlalchemy as sa
+
         await sqlite_backend.enqueue(sample_task)
 
-        # Verify task exists by checking database directly
-        import aiosqlite
+        count_task = sa.text("SELECT COUNT(*) FROM tasks WHERE id = :id")
+        params = {"id": sample_task.id}
 
-        async with aiosqlite.connect(sqlite_backend.database_path) as db:
-            cursor = await db.execute(
-                "SELECT COUNT(*) FROM tasks WHERE task_id = ?", (sample_task.task_id,)
-            )
-            count = await cursor.fetchone()
-            assert count[0] == 1
+        # One connection from the backend's own pool serves both checks
+        async with sqlite_backend.engine.connect() as conn:
+            # Verify task exists by checking database directly
+            assert await conn.scalar(count_task, params) == 1
 
-        # Delete the task
-        await sqlite_backend.delete_task(sample_task.task_id)
+            # Delete the task
+            await sqlite_backend.delete_task(sample_task.id)
 
-        # Verify task is gone
-        async with aiosqlite.connect(sqlite_backend.database_path) as db:
-            cursor = await db.execute(
-                "SELECT COUNT(*) FROM tasks WHERE task_id = ?", (sample_task.task_id,)
-            )
-            count = await cursor.fetchone()
-            assert count[0] == 0
+            # Verify task is gone
+            assert await conn.scalar(count_task, params) == 0
 
-    @pytest.mark.asyncio
+    @pytest.mark.xfail(
+        strict=True,
+        raises=AttributeError,
+        reason="SQLiteBackend has no get_queue_stats() yet",
+    )
     async def test_get_queue_stats(self, sqlite_backend):
         """Test getting queue statistics."""
         # Create tasks with different statuses
-        pending_task = Task(
-            task_id=str(uuid.uuid4()),
-            func="pending_function",
-            args=[],
-            kwargs={},
-            created_at=datetime.now(timezone.utc),
-            eta_at=None,
-            expires_at=None,
-            retry_count=0,
-            max_retries=3,
-            context={},
-        )
+        pending_task = _make_task(func=b"pending_function")
+        success_task = _make_task(func=b"success_function")
+        failed_task = _make_task(func=b"failed_function")
 
-        await sqlite_backend.enqueue(pending_task)
+        await sqlite_backend.enqueue_many([pending_task, success_task, failed_task])
 
-        # Reserve a task
-        reserved_tasks = await sqlite_backend.reserve(1, datetime.now(timezone.utc))
-        assert len(reserved_tasks) == 1
+        # Reserve all three, leaving the pending task reserved
+        reserved_tasks = await sqlite_backend.reserve(3, datetime.now(timezone.utc))
+        assert len(reserved_tasks) == 3
 
-        # Mark another task as successful
-        success_task = Task(
-            task_id=str(uuid.uuid4()),
-            func="success_function",
-            args=[],
-            kwargs={},
-            created_at=datetime.now(timezone.utc),
-            eta_at=None,
-            expires_at=None,
-            retry_count=0,
-            max_retries=3,
-            context={},
-        )
-        await sqlite_backend.enqueue(success_task)
-        await sqlite_backend.reserve(1, datetime.now(timezone.utc))
-        await sqlite_backend.mark_success(success_task.task_id, b"success")
-
-        # Mark another task as failed
-        failed_task = Task(
-            task_id=str(uuid.uuid4()),
-            func="failed_function",
-            args=[],
-            kwargs={},
-            created_at=datetime.now(timezone.utc),
-            eta_at=None,
-            expires_at=None,
-            retry_count=0,
-            max_retries=3,
-            context={},
-        )
-        await sqlite_backend.enqueue(failed_task)
-        await sqlite_backend.reserve(1, datetime.now(timezone.utc))
-        await sqlite_backend.mark_failure(failed_task.task_id, "error", "traceback")
+        await sqlite_backend.mark_success(success_task.id, b"success")
+        await sqlite_backend.mark_failure(failed_task.id, "error", "traceback")
 
         # Get stats
         stats = await sqlite_backend.get_queue_stats()
@@ -366,22 +471,10 @@ class TestSQLiteBackend:
         assert stats["completed"] >= 1
         assert stats["failed"] >= 1
 
-    @pytest.mark.asyncio
     async def test_concurrent_reservations(self, sqlite_backend):
         """Test that concurrent reservations don't duplicate tasks."""
         # Create a single task
-        task = Task(
-            task_id=str(uuid.uuid4()),
-            func="concurrent_function",
-            args=[],
-            kwargs={},
-            created_at=datetime.now(timezone.utc),
-            eta_at=None,
-            expires_at=None,
-            retry_count=0,
-            max_retries=3,
-            context={},
-        )
+        task = _make_task(func=b"concurrent_function")
         await sqlite_backend.enqueue(task)
 
         # Try to reserve concurrently
@@ -399,3 +492,20 @@ class TestSQLiteBackend:
         # The task should be reserved by exactly one caller
         reserved_by_count = sum(1 for reserved in results if len(reserved) > 0)
         assert reserved_by_count == 1
+
+
+@pytest.mark.parametrize(
+    "pragmas",
+    [{"bad name": 1}, {"journal_mode": "WAL; DROP TABLE tasks"}, {"cache_size": 1.5}],
+    ids=["name", "injected-value", "float-value"],
+)
+def test_invalid_pragmas_rejected(pragmas):
+    """Test that PRAGMA names and values must be plain SQL tokens."""
+    with pytest.raises(ValidationError, match="PRAGMA"):
+        SQLiteBackend(":memory:", pragmas=pragmas)
+
+
+def test_connection_pool_rejected_for_memory_db():
+    """Test that pool sizing is refused for in-memory databases."""
+    with pytest.raises(ValidationError, match="pool_size"):
+        SQLiteBackend(":memory:", pool_size=2)
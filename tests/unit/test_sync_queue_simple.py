@@ -1,185 +1,118 @@
 """Simple test for SyncTaskQueue functionality."""
 
 import asyncio
-import tempfile
 import threading
-import time
-import uuid
 from datetime import datetime, timezone, timedelta
 
+import pytest
+
 from src.sitq.backends.sqlite import SQLiteBackend
+from src.sitq.exceptions import TaskExecutionError
 from src.sitq.sync import SyncTaskQueue
 from src.sitq.worker import Worker
 
+# Keep these tests on one xdist worker so they share a single running_worker
+pytestmark = pytest.mark.xdist_group("sync_queue")
 
-def test_sync_queue_basic():
-    """Test basic SyncTaskQueue functionality."""
-    # Create backend
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-        backend = SQLiteBackend(tmp.name)
 
-        # Test SyncTaskQueue as context manager
-        with SyncTaskQueue(backend) as queue:
-            print("✓ SyncTaskQueue started")
+# Module-level tasks pickle by reference instead of by value
+def hello_task():
+    return "Hello from sync queue!"
+
+
+def failing_task():
+    raise ValueError("Test error from sync queue")
+
 
-            # Start a worker in background
-            worker = Worker(backend, max_concurrency=1, poll_interval=0.1)
+def eta_task():
+    return "ETA task completed"
 
-            def run_worker():
-                asyncio.run(worker.start())
 
-            worker_thread = threading.Thread(target=run_worker, daemon=True)
-            worker_thread.start()
+@pytest.fixture(scope="module")
+def running_worker(tmp_path_factory):
+    """Run one SyncTaskQueue and background worker for every test in the module."""
+    db_path = tmp_path_factory.mktemp("sync_queue") / "tasks.db"
+    backend = SQLiteBackend(str(db_path))
 
-            try:
-                # Give worker time to start
-                time.sleep(0.5)
+    with SyncTaskQueue(backend) as queue:
+        print("✓ SyncTaskQueue started")
 
-                # Test enqueue
-                def test_task():
-                    return "Hello from sync queue!"
+        # Start a worker in background on its own loop
+        worker = Worker(backend, max_concurrency=1, poll_interval=1.0)
+        worker_loop = asyncio.new_event_loop()
 
-                task_id = queue.enqueue(test_task)
-                print(f"✓ Task enqueued with ID: {task_id}")
+        worker_thread = threading.Thread(target=worker_loop.run_forever, daemon=True)
+        worker_thread.start()
+        worker_run = asyncio.run_coroutine_threadsafe(worker.start(), worker_loop)
 
-                # Test get_result
-                result = queue.get_result(task_id, timeout=5.0)
-                print(f"✓ Task result: {result}")
-                assert result == "Hello from sync queue!"
-                print("✓ Basic SyncTaskQueue test passed!")
-                return
+        try:
+            assert worker.ready_event.wait(timeout=2.0), "Worker did not start"
+            yield queue, worker
 
-            finally:
-                # Stop worker
-                stop_loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(stop_loop)
-                try:
-                    stop_loop.run_until_complete(worker.stop())
-                finally:
-                    stop_loop.close()
-                worker_thread.join(timeout=5.0)
-                print("✓ Worker stopped")
+        finally:
+            # Stop worker on the loop it runs on
+            asyncio.run_coroutine_threadsafe(worker.stop(), worker_loop).result(
+                timeout=5.0
+            )
+            worker_run.result(timeout=5.0)
+            worker_loop.call_soon_threadsafe(worker_loop.stop)
+            worker_thread.join(timeout=5.0)
+            worker_loop.close()
+            print("✓ Worker stopped")
+
+    print("✓ SyncTaskQueue stopped")
+
+
+def test_sync_queue_basic(running_worker):
+    """Test basic SyncTaskQueue functionality."""
+    queue, _ = running_worker
 
-        print("✓ SyncTaskQueue stopped")
+    # Test enqueue
+    task_id = queue.enqueue(hello_task)
+    print(f"✓ Task enqueued with ID: {task_id}")
 
+    # Test get_result
+    result = queue.get_result(task_id, timeout=5.0)
+    print(f"✓ Task result: {result}")
+    assert result == "Hello from sync queue!"
+    print("✓ Basic SyncTaskQueue test passed!")
 
-def test_sync_queue_error_handling():
+
+def test_sync_queue_error_handling(running_worker):
     """Test error handling in SyncTaskQueue."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-        backend = SQLiteBackend(tmp.name)
-
-        with SyncTaskQueue(backend) as queue:
-            print("✓ SyncTaskQueue started for error test")
-
-            # Start a worker in background
-            worker = Worker(backend, max_concurrency=1, poll_interval=0.1)
-
-            def run_worker():
-                asyncio.run(worker.start())
-
-            worker_thread = threading.Thread(target=run_worker, daemon=True)
-            worker_thread.start()
-
-            try:
-                # Give worker time to start
-                time.sleep(0.5)
-
-                # Test with failing task
-                def failing_task():
-                    raise ValueError("Test error from sync queue")
-
-                task_id = queue.enqueue(failing_task)
-                print(f"✓ Failing task enqueued with ID: {task_id}")
-
-                # Test get_result for failure - should raise exception
-                try:
-                    result = queue.get_result(task_id, timeout=5.0)
-                    print("✗ Expected exception but got result:", result)
-                    return
-                except Exception as e:
-                    print(f"✓ Task error captured: {e}")
-                    assert "Test error from sync queue" in str(e)
-                    print("✓ Error handling test passed!")
-                    return
-
-            finally:
-                # Stop worker
-                stop_loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(stop_loop)
-                try:
-                    stop_loop.run_until_complete(worker.stop())
-                finally:
-                    stop_loop.close()
-                worker_thread.join(timeout=5.0)
-                print("✓ Worker stopped")
-
-        print("✓ SyncTaskQueue stopped")
-
-
-def test_sync_queue_eta():
+    queue, _ = running_worker
+
+    # Test with failing task
+    task_id = queue.enqueue(failing_task)
+    print(f"✓ Failing task enqueued with ID: {task_id}")
+
+    # Test get_result for failure - should raise exception
+    with pytest.raises(TaskExecutionError, match="Test error from sync queue"):
+        queue.get_result(task_id, timeout=5.0)
+    print("✓ Error handling test passed!")
+
+
+def test_sync_queue_eta(running_worker):
     """Test ETA scheduling with SyncTaskQueue."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-        backend = SQLiteBackend(tmp.name)
-
-        with SyncTaskQueue(backend) as queue:
-            print("✓ SyncTaskQueue started for ETA test")
-
-            # Start a worker in background
-            worker = Worker(backend, max_concurrency=1, poll_interval=0.1)
-
-            def run_worker():
-                asyncio.run(worker.start())
-
-            worker_thread = threading.Thread(target=run_worker, daemon=True)
-            worker_thread.start()
-
-            try:
-                # Give worker time to start
-                time.sleep(0.5)
-
-                # Test with future ETA
-                def eta_task():
-                    return "ETA task completed"
-
-                future_time = datetime.now(timezone.utc) + timedelta(seconds=2)
-                task_id = queue.enqueue(eta_task, eta=future_time)
-                print(f"✓ ETA task enqueued with ID: {task_id}")
-
-                # Should not complete immediately
-                result = queue.get_result(task_id, timeout=1.0)
-                if result is None:
-                    print("✓ Task correctly delayed by ETA")
-                else:
-                    print("✗ Task executed too early")
-                    return
-
-                # Wait past ETA time
-                time.sleep(2.5)
-                result = queue.get_result(task_id, timeout=5.0)
-                print(f"✓ ETA task result: {result}")
-                assert result == "ETA task completed"
-                print("✓ ETA scheduling test passed!")
-                return
-
-            finally:
-                # Stop worker
-                stop_loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(stop_loop)
-                try:
-                    stop_loop.run_until_complete(worker.stop())
-                finally:
-                    stop_loop.close()
-                worker_thread.join(timeout=5.0)
-                print("✓ Worker stopped")
-
-        print("✓ SyncTaskQueue stopped")
+    queue, _ = running_worker
+
+    # Test with future ETA
+    future_time = datetime.now(timezone.utc) + timedelta(seconds=2)
+    task_id = queue.enqueue(eta_task, eta=future_time)
+    print(f"✓ ETA task enqueued with ID: {task_id}")
+
+    # Should not complete immediately
+    result = queue.get_result(task_id, timeout=1.0)
+    assert result is None, "Task executed before its ETA"
+    print("✓ Task correctly delayed by ETA")
+
+    # Blocks until the worker runs the task, which it picks up at the ETA
+    result = queue.get_result(task_id, timeout=5.0)
+    print(f"✓ ETA task result: {result}")
+    assert result is not None
+    assert result == "ETA task completed"
+    print("✓ ETA scheduling test passed!")
 
 
 if __name__ == "__main__":
-    print("Testing SyncTaskQueue...")
-    test_sync_queue_basic()
-    print()
-    test_sync_queue_error_handling()
-    print()
-    test_sync_queue_eta()
-    print("All SyncTaskQueue tests completed!")
+    pytest.main([__file__, "-s"])
@@ -89,7 +89,6 @@ def task_queue(mock_backend):
     return TaskQueue(backend=mock_backend)
 
 
-@pytest.mark.asyncio
 async def test_taskqueue_enqueue_immediate_task(task_queue, mock_backend):
     """Test enqueueing a task without ETA (immediate execution)."""
 
@@ -116,7 +115,6 @@ async def test_taskqueue_enqueue_immediate_task(task_queue, mock_backend):
     assert envelope["kwargs"] == {}
 
 
-@pytest.mark.asyncio
 async def test_taskqueue_enqueue_delayed_task(task_queue, mock_backend):
     """Test enqueueing a task with ETA (delayed execution)."""
 
@@ -143,7 +141,28 @@ async def test_taskqueue_enqueue_delayed_task(task_queue, mock_backend):
     assert envelope["kwargs"] == {}
 
 
-@pytest.mark.asyncio
+async def test_taskqueue_enqueue_many(task_queue, mock_backend):
+    """Test enqueueing several tasks in one batch."""
+
+    def test_func(x, y=0):
+        return x + y
+
+    task_ids = await task_queue.enqueue_many(
+        [(test_func, (i,), {"y": 10}) for i in range(3)]
+    )
+
+    # Verify one task per spec, returned in order
+    assert len(task_ids) == 3
+    assert len(set(task_ids)) == 3
+
+    for i, task_id in enumerate(task_ids):
+        task = mock_backend.tasks[task_id]
+        envelope = task_queue.serializer.loads(task.func)
+        assert envelope["args"] == (i,)
+        assert envelope["kwargs"] == {"y": 10}
+        assert envelope["func"](*envelope["args"], **envelope["kwargs"]) == i + 10
+
+
 async def test_taskqueue_get_result_success(task_queue, mock_backend):
     """Test getting a successful result."""
     task_id = "test-task-123"
@@ -167,7 +186,6 @@ async def test_taskqueue_get_result_success(task_queue, mock_backend):
     assert retrieved_result.value == b"42"
 
 
-@pytest.mark.asyncio
 async def test_taskqueue_get_result_failure(task_queue, mock_backend):
     """Test getting a failed result."""
     task_id = "test-task-456"
@@ -193,7 +211,6 @@ async def test_taskqueue_get_result_failure(task_queue, mock_backend):
     assert retrieved_result.value is None
 
 
-@pytest.mark.asyncio
 async def test_taskqueue_get_result_timeout(task_queue, mock_backend):
     """Test getting result with timeout when result is not ready."""
     task_id = "test-task-789"
@@ -206,7 +223,6 @@ async def test_taskqueue_get_result_timeout(task_queue, mock_backend):
     assert result is None
 
 
-@pytest.mark.asyncio
 async def test_taskqueue_context_manager(task_queue, mock_backend):
     """Test TaskQueue as async context manager."""
     async with task_queue as tq:
@@ -216,7 +232,6 @@ async def test_taskqueue_context_manager(task_queue, mock_backend):
     assert not mock_backend.connected
 
 
-@pytest.mark.asyncio
 async def test_taskqueue_close(task_queue, mock_backend):
     """Test closing TaskQueue."""
     # Initially not connected
@@ -229,7 +244,6 @@ async def test_taskqueue_close(task_queue, mock_backend):
     assert not mock_backend.connected
 
 
-@pytest.mark.asyncio
 async def test_taskqueue_enqueue_with_kwargs(task_queue, mock_backend):
     """Test enqueueing task with keyword arguments."""
 
@@ -256,7 +270,6 @@ async def test_taskqueue_enqueue_with_kwargs(task_queue, mock_backend):
     assert envelope["kwargs"] == {"operation": "multiply"}
 
 
-@pytest.mark.asyncio
 async def test_taskqueue_eta_timezone_aware(task_queue, mock_backend):
     """Test that ETA accepts timezone-aware datetime."""
 
@@ -272,7 +285,6 @@ async def test_taskqueue_eta_timezone_aware(task_queue, mock_backend):
     assert task.available_at == eta
 
 
-@pytest.mark.asyncio
 async def test_taskqueue_available_at_defaults_to_now(task_queue, mock_backend):
     """Test that available_at defaults to current time when no ETA provided."""
 
@@ -8,7 +8,12 @@ from sitq.core import ReservedTask
 from datetime import datetime, timezone
 
 
-@pytest.mark.asyncio
+async def short_task(value):
+    """Module-level task so cloudpickle serializes it by reference."""
+    await asyncio.sleep(0.05)
+    return value
+
+
 @pytest.mark.timeout(10)
 async def test_worker_never_exceeds_max_concurrency():
     """
@@ -24,9 +29,9 @@ async def test_worker_never_exceeds_max_concurrency():
     queue = TaskQueue(backend)
 
     # Track concurrent executions
+    # Plain ints are safe: nothing awaits between a read and its write
     concurrent_count = 0
     max_observed = 0
-    count_lock = asyncio.Lock()
 
     # Barrier to synchronize task starts
     # This ensures all tasks start before any complete
@@ -38,9 +43,8 @@ async def test_worker_never_exceeds_max_concurrency():
         nonlocal concurrent_count, max_observed
 
         # Increment counter
-        async with count_lock:
-            concurrent_count += 1
-            max_observed = max(max_observed, concurrent_count)
+        concurrent_count += 1
+        max_observed = max(max_observed, concurrent_count)
 
         # Wait for all tasks to start (ensures we capture max concurrency)
         await start_barrier.wait()
@@ -52,16 +56,12 @@ async def test_worker_never_exceeds_max_concurrency():
         await end_barrier.wait()
 
         # Decrement counter
-        async with count_lock:
-            concurrent_count -= 1
+        concurrent_count -= 1
 
         return value
 
-    # Enqueue 5 tasks
-    task_ids = []
-    for i in range(5):
-        task_id = await queue.enqueue(counting_task, i)
-        task_ids.append(task_id)
+    # Enqueue 5 tasks in a single batch
+    task_ids = await queue.enqueue_many([(counting_task, (i,), {}) for i in range(5)])
 
     # Create worker with max_concurrency=2
     worker = Worker(backend, max_concurrency=2, poll_interval=0.01)
@@ -89,7 +89,6 @@ async def test_worker_never_exceeds_max_concurrency():
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.timeout(10)
 async def test_stop_waits_for_in_flight_tasks():
     """
@@ -136,7 +135,6 @@ async def test_stop_waits_for_in_flight_tasks():
     assert result == "done"
 
 
-@pytest.mark.asyncio
 @pytest.mark.timeout(10)
 async def test_concurrency_with_failures():
     """
@@ -148,36 +146,29 @@ async def test_concurrency_with_failures():
     await backend.connect()
     queue = TaskQueue(backend)
 
-    # Track execution
+    # Track execution; plain ints suffice under cooperative scheduling
     execution_count = 0
     failure_count = 0
     success_count = 0
-    execution_lock = asyncio.Lock()
     barrier = asyncio.Barrier(5)
 
     async def failing_task(value):
         nonlocal execution_count, failure_count, success_count
 
-        async with execution_lock:
-            execution_count += 1
+        execution_count += 1
 
         await barrier.wait()
 
         # Every other task fails
         if value % 2 == 0:
-            async with execution_lock:
-                failure_count += 1
+            failure_count += 1
             raise ValueError(f"Task {value} failed")
         else:
-            async with execution_lock:
-                success_count += 1
+            success_count += 1
             return value
 
-    # Enqueue 5 tasks
-    task_ids = []
-    for i in range(5):
-        task_id = await queue.enqueue(failing_task, i)
-        task_ids.append(task_id)
+    # Enqueue 5 tasks in a single batch
+    task_ids = await queue.enqueue_many([(failing_task, (i,), {}) for i in range(5)])
 
     # Create worker with max_concurrency=3
     worker = Worker(backend, max_concurrency=3, poll_interval=0.01)
@@ -201,3 +192,105 @@ async def test_concurrency_with_failures():
     # Verify results (failed tasks should be None)
     expected = [None, 1, None, 3, None]
     assert results == expected
+
+
+@pytest.mark.timeout(10)
+async def test_drain_waits_for_ready_tasks(tmp_path):
+    """
+    Verify that drain() resolves only after every ready task has finished.
+    """
+
+    # File-backed: Worker.start() reconnects, which would reset ":memory:"
+    backend = SQLiteBackend(str(tmp_path / "drain.db"))
+    await backend.connect()
+    queue = TaskQueue(backend)
+
+    task_ids = await queue.enqueue_many([(short_task, (i,), {}) for i in range(4)])
+
+    async with Worker(backend, max_concurrency=2, poll_interval=0.01) as worker:
+        await worker.drain()
+
+        # Every task must already have a result - no polling needed
+        for i, task_id in enumerate(task_ids):
+            result = await backend.get_result(task_id)
+            assert result is not None
+            assert result.status == "success"
+            assert queue.deserialize_result(result) == i
+
+
+@pytest.mark.timeout(10)
+async def test_worker_context_manager_stops_on_error(tmp_path):
+    """
+    Verify that leaving the context on an exception still stops the worker.
+    """
+    backend = SQLiteBackend(str(tmp_path / "context.db"))
+    worker = Worker(backend, poll_interval=0.01)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        async with worker:
+            assert worker._running
+            assert worker.ready_event.is_set()
+            raise RuntimeError("boom")
+
+    assert not worker._running
+    assert not worker.ready_event.is_set()
+    assert worker._run_task is None
+
+
+@pytest.mark.timeout(10)
+async def test_idle_worker_wakes_on_enqueue(tmp_path):
+    """
+    Verify that an idle worker picks up a new task without waiting out poll_interval.
+    """
+    backend = SQLiteBackend(str(tmp_path / "wake.db"))
+    await backend.connect()
+    queue = TaskQueue(backend)
+
+    async with Worker(backend, poll_interval=60) as worker:
+        await worker.drain()
+
+        task_id = await queue.enqueue(short_task, 7)
+        result = await asyncio.wait_for(queue.get_result(task_id), timeout=2.0)
+
+        assert result is not None
+        assert result.status == "success"
+        assert queue.deserialize_result(result) == 7
+
+
+@pytest.mark.timeout(10)
+async def test_failed_wait_falls_back_to_poll_interval(tmp_path, monkeypatch):
+    """
+    Verify that a failing wait_for_new_task does not turn the idle loop into a busy loop.
+    """
+    backend = SQLiteBackend(str(tmp_path / "broken_wait.db"))
+    await backend.connect()
+    calls = 0
+
+    async def broken_wait(timeout):
+        nonlocal calls
+        calls += 1
+        raise RuntimeError("wait failed")
+
+    monkeypatch.setattr(backend, "wait_for_new_task", broken_wait)
+
+    async with Worker(backend, poll_interval=0.1):
+        await asyncio.sleep(0.5)
+
+    assert 1 <= calls <= 8
+
+
+@pytest.mark.timeout(10)
+async def test_worker_context_manager_rejects_reentry(tmp_path):
+    """
+    Verify that entering an already running worker raises instead of starting it twice.
+    """
+    backend = SQLiteBackend(str(tmp_path / "reentry.db"))
+    await backend.connect()
+
+    async with Worker(backend, poll_interval=0.1) as worker:
+        with pytest.raises(RuntimeError, match="Worker already running"):
+            await worker.__aenter__()
+        assert worker._run_task is not None
+
+    assert worker._run_task is None
+    await backend.close()
@@ -2,7 +2,6 @@
 
 import asyncio
 import tempfile
-import time
 import uuid
 from datetime import datetime, timezone
 
@@ -12,6 +11,11 @@ from src.sitq.worker import Worker
 from src.sitq.serialization import CloudpickleSerializer
 
 
+def hello_task():
+    """Module-level task so cloudpickle serializes it by reference."""
+    return "Hello from worker!"
+
+
 async def test_worker_basic():
     """Test basic worker functionality."""
     # Create backend and serializer
@@ -22,12 +26,9 @@ async def test_worker_basic():
         await backend.connect()
 
         # Create a simple task
-        def test_task():
-            return "Hello from worker!"
-
         task = Task(
             id=str(uuid.uuid4()),
-            func=serializer.dumps(test_task),
+            func=serializer.serialize_task_envelope(hello_task),
             created_at=datetime.now(timezone.utc),
         )
 
@@ -46,21 +47,13 @@ async def test_worker_basic():
         worker_task = asyncio.create_task(worker.start())
 
         try:
-            # Wait for task to complete
-            timeout = 5.0
-            start_time = time.time()
-
-            while time.time() - start_time < timeout:
-                result = await backend.get_result(task.id)
-                if result and result.status == "success":
-                    completed_result = serializer.loads(result.value)
-                    assert completed_result == "Hello from worker!"
-                    print("✓ Task completed successfully")
-                    print(f"  Result: {completed_result}")
-                    return
-                await asyncio.sleep(0.1)
-
-            print("✗ Task did not complete within timeout")
+            # Wake as soon as the worker records the result
+            result = await backend.wait_for_result(task.id, timeout=5.0)
+            assert result is not None and result.status == "success"
+            completed_result = serializer.loads(result.value)
+            assert completed_result == "Hello from worker!"
+            print("✓ Task completed successfully")
+            print(f"  Result: {completed_result}")
 
         finally:
             await worker.stop()
@@ -1,262 +1,287 @@
-#!/usr/bin/env python3
 """
 Simple test to verify documentation completeness without requiring mkdocstrings.
 
-This script checks:
+These tests check:
 1. All public APIs are accessible
 2. All docstrings are present
 3. Cross-references exist in documentation
 4. Examples are syntactically valid
 """
 
-import sys
 import ast
-import importlib
-import inspect
+import bisect
+import contextlib
+import hashlib
+import mmap
+import os
+import re
 from pathlib import Path
 
-
-def test_public_api_access():
-    """Test if all public APIs are accessible."""
+import pytest
+
+import sitq
+
+# Public names sitq must export
+_REQUIRED_COMPONENTS = (
+    "TaskQueue",
+    "Worker",
+    "SyncTaskQueue",
+    "Task",
+    "Result",
+    "ReservedTask",
+    "SQLiteBackend",
+    "Backend",
+    "Serializer",
+    "CloudpickleSerializer",
+)
+
+# Main classes that must carry a docstring
+_CLASSES_TO_CHECK = (
+    sitq.TaskQueue,
+    sitq.Worker,
+    sitq.SyncTaskQueue,
+    sitq.Task,
+    sitq.Result,
+    sitq.SQLiteBackend,
+)
+
+# Only the first few code blocks are syntax-checked
+MAX_CHECKED_BLOCKS = 10
+
+# Cross-reference markers expected somewhere in the docs
+_CROSS_REF_PATTERNS = (
+    "[`TaskQueue`]",
+    "[`Worker`]",
+    "[`SQLiteBackend`]",
+    "See Also:",
+    "## See Also",
+)
+
+# Line placed between code blocks when they are parsed as one module
+_BLOCK_SEPARATOR = "\n# ---SITQ_DOC_BLOCK_SEP---\n"
+
+# pytest cache key for syntax-check outcomes, keyed by code block hash
+_DOC_AST_CACHE_KEY = "sitq/doc_ast"
+
+# Documentation pages required by the Diátaxis layout
+_REQUIRED_DOC_FILES = (
+    "docs/index.md",
+    "docs/explanation/architecture.md",
+    "docs/explanation/limitations.md",
+    "docs/explanation/serialization.md",
+    "docs/how-to/installation.md",
+    "docs/how-to/deployment.md",
+    "docs/how-to/error-handling.md",
+    "docs/how-to/get-results.md",
+    "docs/how-to/handle-failures.md",
+    "docs/how-to/performance.md",
+    "docs/how-to/run-worker.md",
+    "docs/how-to/serialization.md",
+    "docs/how-to/sqlite-backend.md",
+    "docs/how-to/sync-wrapper.md",
+    "docs/how-to/testing.md",
+    "docs/how-to/troubleshooting.md",
+    "docs/how-to/workers.md",
+    "docs/how-to/contributing.md",
+    "docs/tutorials/index.md",
+    "docs/tutorials/quickstart.md",
+    "docs/tutorials/basic-concepts.md",
+    "docs/tutorials/concurrency.md",
+    "docs/tutorials/delayed-execution.md",
+    "docs/tutorials/failures.md",
+    "docs/tutorials/interactive-tutorial.ipynb",
+    "docs/reference/ERROR_HANDLING.md",
+    "docs/reference/changelog.md",
+    "docs/reference/api/sitq.md",
+)
+
+
+def _syntax_error(code):
+    """Return the SyntaxError message for ``code``, or None if it parses."""
     try:
-        import sitq
-
-        # Test core components
-        required_components = [
-            "TaskQueue",
-            "Worker",
-            "SyncTaskQueue",
-            "Task",
-            "Result",
-            "ReservedTask",
-            "SQLiteBackend",
-            "Backend",
-            "Serializer",
-            "CloudpickleSerializer",
-        ]
-
-        missing_components = []
-        for component in required_components:
-            if not hasattr(sitq, component):
-                missing_components.append(component)
-
-        if missing_components:
-            print(f"❌ Missing components: {missing_components}")
-            return False
-        else:
-            print("✅ All required components are accessible")
-            return True
-
-    except ImportError as e:
-        print(f"❌ Failed to import sitq: {e}")
-        return False
+        ast.parse(code)
+    except SyntaxError as e:
+        return str(e)
+    return None
 
 
-def test_docstring_presence():
-    """Test if all public APIs have docstrings."""
+def _syntax_errors(blocks):
+    """Syntax-check ``blocks`` with one ast.parse call where possible.
+
+    The blocks are joined into a single module. If it parses and no
+    top-level statement straddles two blocks, every block is valid on its
+    own; otherwise each block is parsed separately to find the offenders.
+    Returns one _syntax_error() result per block.
+    """
+    joined = _BLOCK_SEPARATOR.join(blocks)
     try:
-        import sitq
-
-        # Test main classes
-        classes_to_check = [
-            sitq.TaskQueue,
-            sitq.Worker,
-            sitq.SyncTaskQueue,
-            sitq.Task,
-            sitq.Result,
-            sitq.SQLiteBackend,
-        ]
-
-        missing_docstrings = []
-        for cls in classes_to_check:
-            if not cls.__doc__ or not cls.__doc__.strip():
-                missing_docstrings.append(cls.__name__)
-
-        if missing_docstrings:
-            print(f"❌ Classes missing docstrings: {missing_docstrings}")
-            return False
-        else:
-            print("✅ All main classes have docstrings")
-            return True
-
-    except Exception as e:
-        print(f"❌ Docstring test failed: {e}")
-        return False
-
-
-def test_cross_references():
-    """Test if cross-references exist in documentation (agnostic to file paths)."""
+        tree = ast.parse(joined)
+    except SyntaxError:
+        return [_syntax_error(code) for code in blocks]
+
+    # First line of each block in the joined source
+    starts = []
+    line = 1
+    for code in blocks:
+        starts.append(line)
+        line += code.count("\n") + 2
+
+    for node in tree.body:
+        first = min(
+            [node.lineno] + [d.lineno for d in getattr(node, "decorator_list", ())]
+        )
+        if bisect.bisect_right(starts, first) != bisect.bisect_right(
+            starts, node.end_lineno
+        ):
+            # Only valid when joined, e.g. a bracket opened in one block
+            # and closed in the next
+            return [_syntax_error(code) for code in blocks]
+
+    return [None] * len(blocks)
+
+
+def _extract_py_blocks(lines, out, limit):
+    """Append the bodies of ```python fences in byte ``lines`` to ``out``.
+
+    A single pass over the lines; only captured blocks are decoded. Stops as
+    soon as ``out`` holds ``limit`` blocks and returns True in that case.
+    """
+    in_block = False
+    buf = []
+    for raw_line in lines:
+        line = raw_line.rstrip(b"\r\n")
+        if line == b"```python":
+            in_block = True
+            buf.clear()
+            continue
+        if in_block and line == b"```":
+            out.append(b"\n".join(buf).decode("utf-8"))
+            in_block = False
+            if len(out) >= limit:
+                return True
+            continue
+        if in_block:
+            buf.append(line)
+    return False
+
+
+@pytest.fixture(scope="session")
+def docs_md():
+    """Memory-map every non-empty Markdown file under docs/ for the session.
+
+    Yields (path, mmap) pairs; searches run on the raw bytes, so files are
+    never decoded as a whole.
+    """
     docs_dir = Path("docs")
+    assert docs_dir.is_dir(), "Documentation directory not found"
+
+    with contextlib.ExitStack() as stack:
+        maps = []
+        for path in docs_dir.rglob("*.md"):
+            # mmap cannot map an empty file
+            if path.stat().st_size == 0:
+                continue
+            f = stack.enter_context(path.open("rb"))
+            mm = stack.enter_context(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            maps.append((path, mm))
+        yield tuple(maps)
+
+
+@pytest.fixture(scope="session")
+def doc_code_blocks(docs_md):
+    """The first MAX_CHECKED_BLOCKS ```python blocks found in the docs."""
+    blocks = []
+    for _, mm in docs_md:
+        mm.seek(0)
+        if _extract_py_blocks(iter(mm.readline, b""), blocks, MAX_CHECKED_BLOCKS):
+            break
+    return blocks
 
-    if not docs_dir.exists():
-        print("❌ Documentation directory not found")
-        return False
-
-    # Check for cross-reference patterns (agnostic to which file they're in)
-    cross_ref_patterns = [
-        "[`TaskQueue`]",
-        "[`Worker`]",
-        "[`SQLiteBackend`]",
-        "See Also:",
-        "## See Also",
-    ]
 
-    found_references = 0
-    for pattern in cross_ref_patterns:
-        for file in docs_dir.rglob("*.md"):
-            content = file.read_text()
-            if pattern in content:
-                found_references += 1
-                break
-
-    expected_references = len(cross_ref_patterns)
-    if found_references >= expected_references * 0.8:  # Allow 80% match
-        print(f"✅ Cross-references found: {found_references}/{expected_references}")
-        return True
-    else:
-        print(
-            f"❌ Insufficient cross-references: {found_references}/{expected_references}"
-        )
-        return False
+def test_public_api_access():
+    """Test if all public APIs are accessible."""
+    missing_components = [c for c in _REQUIRED_COMPONENTS if not hasattr(sitq, c)]
 
+    assert not missing_components, f"Missing components: {missing_components}"
 
-def test_example_syntax():
-    """Test if code examples in documentation are syntactically valid."""
-    docs_dir = Path("docs")
 
-    if not docs_dir.exists():
-        print("❌ Documentation directory not found")
-        return False
+def test_docstring_presence():
+    """Test if all public APIs have docstrings."""
+    missing_docstrings = [
+        cls.__name__
+        for cls in _CLASSES_TO_CHECK
+        if not cls.__doc__ or not cls.__doc__.strip()
+    ]
 
-    # Find Python code blocks
-    python_code_blocks = []
+    assert not missing_docstrings, f"Classes missing docstrings: {missing_docstrings}"
 
-    for file in docs_dir.rglob("*.md"):
-        content = file.read_text()
 
-        # Find Python code blocks
-        import re
+def test_cross_references(docs_md):
+    """Test if cross-references exist in documentation (agnostic to file paths)."""
+    # One pass per file for all patterns. The lookahead also reports matches
+    # that overlap, e.g. "See Also:" inside "## See Also:"
+    patterns = [pattern.encode("utf-8") for pattern in _CROSS_REF_PATTERNS]
+    combined = re.compile(b"(?=(" + b"|".join(map(re.escape, patterns)) + b"))")
+
+    seen = set()
+    for _, mm in docs_md:
+        seen.update(match.group(1).decode("utf-8") for match in combined.finditer(mm))
+        if len(seen) == len(_CROSS_REF_PATTERNS):
+            break
+
+    found_references = len(seen)
+    expected_references = len(_CROSS_REF_PATTERNS)
+    # Allow 80% match
+    assert found_references >= expected_references * 0.8, (
+        f"Insufficient cross-references: {found_references}/{expected_references}, "
+        f"missing {sorted(set(_CROSS_REF_PATTERNS) - seen)}"
+    )
+
+
+def test_example_syntax(request, doc_code_blocks):
+    """Test if code examples in documentation are syntactically valid."""
+    assert doc_code_blocks, "No Python code blocks found in the docs"
 
-        code_blocks = re.findall(r"```python\n(.*?)\n```", content, re.DOTALL)
-        python_code_blocks.extend(code_blocks)
+    keys = [
+        hashlib.blake2b(code.encode("utf-8"), digest_size=8).hexdigest()
+        for code in doc_code_blocks
+    ]
 
-    print(f"Found {len(python_code_blocks)} Python code blocks")
+    # Parse only blocks not seen on the last run, all in one go. The pytest
+    # cache is absent under -p no:cacheprovider, so nothing is kept then
+    config_cache = getattr(request.config, "cache", None)
+    cache = {}
+    if config_cache is not None:
+        cache = config_cache.get(_DOC_AST_CACHE_KEY, {})
+    fresh = {key: code for key, code in zip(keys, doc_code_blocks) if key not in cache}
+    cache.update(zip(fresh, _syntax_errors(list(fresh.values()))))
 
-    # Test syntax of code blocks
-    valid_blocks = 0
+    checked = {}
     syntax_errors = []
+    for i, key in enumerate(keys):
+        error = checked[key] = cache[key]
+        if error is not None:
+            syntax_errors.append(f"Block {i}: {error}")
 
-    for i, code in enumerate(python_code_blocks[:10]):  # Test first 10
-        try:
-            ast.parse(code)
-            valid_blocks += 1
-        except SyntaxError as e:
-            syntax_errors.append(f"Block {i}: {e}")
-
-    if syntax_errors:
-        print(f"❌ Syntax errors found:")
-        for error in syntax_errors:
-            print(f"  {error}")
-        return False
-    else:
-        print(
-            f"✅ All tested code blocks have valid syntax ({valid_blocks}/{min(len(python_code_blocks), 10)})"
-        )
-        return True
+    # Only keep entries for the current blocks so the cache cannot grow
+    if config_cache is not None:
+        config_cache.set(_DOC_AST_CACHE_KEY, checked)
+
+    assert not syntax_errors, "Syntax errors found:\n  " + "\n  ".join(syntax_errors)
 
 
 def test_documentation_structure():
     """Test if documentation has proper structure following Diátaxis layout."""
-    required_files = [
-        "docs/index.md",
-        "docs/explanation/architecture.md",
-        "docs/explanation/limitations.md",
-        "docs/explanation/serialization.md",
-        "docs/how-to/installation.md",
-        "docs/how-to/deployment.md",
-        "docs/how-to/error-handling.md",
-        "docs/how-to/get-results.md",
-        "docs/how-to/handle-failures.md",
-        "docs/how-to/performance.md",
-        "docs/how-to/run-worker.md",
-        "docs/how-to/serialization.md",
-        "docs/how-to/sqlite-backend.md",
-        "docs/how-to/sync-wrapper.md",
-        "docs/how-to/testing.md",
-        "docs/how-to/troubleshooting.md",
-        "docs/how-to/workers.md",
-        "docs/how-to/contributing.md",
-        "docs/tutorials/index.md",
-        "docs/tutorials/quickstart.md",
-        "docs/tutorials/basic-concepts.md",
-        "docs/tutorials/concurrency.md",
-        "docs/tutorials/delayed-execution.md",
-        "docs/tutorials/failures.md",
-        "docs/tutorials/interactive-tutorial.ipynb",
-        "docs/reference/ERROR_HANDLING.md",
-        "docs/reference/changelog.md",
-        "docs/reference/api/sitq.md",
-    ]
-
-    missing_files = []
-    for file_path in required_files:
-        if not Path(file_path).exists():
-            missing_files.append(file_path)
-
-    if missing_files:
-        print(f"❌ Missing documentation files: {missing_files}")
-        return False
-    else:
-        print("✅ All required documentation files exist")
-        return True
-
-
-def main():
-    """Run all documentation tests."""
-    print("🧪 Running documentation validation tests...\n")
-
-    tests = [
-        ("Public API Access", test_public_api_access),
-        ("Docstring Presence", test_docstring_presence),
-        ("Cross-References", test_cross_references),
-        ("Example Syntax", test_example_syntax),
-        ("Documentation Structure", test_documentation_structure),
+    # List the docs tree once instead of stat()ing every required file
+    existing_files = set()
+    for root, _, files in os.walk("docs"):
+        for name in files:
+            existing_files.add(os.path.join(root, name).replace(os.sep, "/"))
+
+    missing_files = [
+        file_path
+        for file_path in _REQUIRED_DOC_FILES
+        if file_path not in existing_files
     ]
 
-    results = []
-    for test_name, test_func in tests:
-        print(f"\n🔍 Running {test_name} test...")
-        try:
-            result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ {test_name} test failed with exception: {e}")
-            results.append((test_name, False))
-
-    # Summary
-    print("\n" + "=" * 60)
-    print("📊 DOCUMENTATION VALIDATION SUMMARY")
-    print("=" * 60)
-
-    passed = 0
-    total = len(results)
-
-    for test_name, result in results:
-        status = "✅ PASS" if result else "❌ FAIL"
-        print(f"{test_name:<25} {status}")
-        if result:
-            passed += 1
-
-    print(f"\nResults: {passed}/{total} tests passed")
-
-    if passed == total:
-        print("🎉 All documentation validation tests passed!")
-        print("✅ The improve-docstring-coverage implementation is complete.")
-        return 0
-    else:
-        print("⚠️  Some tests failed. Please review the issues above.")
-        return 1
-
-
-if __name__ == "__main__":
-    sys.exit(main())
+    assert not missing_files, f"Missing documentation files: {missing_files}"
@@ -5,20 +5,25 @@ and function correctly. Each example is run with a timeout to prevent
 hangs.
 """
 
-import subprocess
+import asyncio
 import sys
 import time
+from collections import deque
 from pathlib import Path
-from typing import List, Tuple
+from typing import Deque, Dict, Tuple
 
 import pytest
 
+# Lines of stdout/stderr kept per example run; the completion marker and any
+# traceback are printed last
+OUTPUT_TAIL_LINES = 200
 
-def get_example_scripts() -> List[Tuple[str, str]]:
-    """Get list of example scripts to validate.
+
+def _find_example_scripts() -> Tuple[Tuple[str, str], ...]:
+    """Find the example scripts that exist on disk.
 
     Returns:
-        List of (script_name, description) tuples.
+        Tuple of (script_name, description) tuples.
     """
     examples_dir = Path(__file__).parent.parent.parent / "examples" / "basic"
 
@@ -30,55 +35,114 @@ def get_example_scripts() -> List[Tuple[str, str]]:
         ("05_sync_client_with_worker.py", "Sync client with async worker"),
     ]
 
-    return [
+    return tuple(
         (str(examples_dir / script), description)
         for script, description in examples
         if (examples_dir / script).exists()
-    ]
+    )
+
+
+# Resolved once at import; every parametrization and fixture reads this
+_EXAMPLES = _find_example_scripts()
+
+
+def get_example_scripts() -> Tuple[Tuple[str, str], ...]:
+    """Get list of example scripts to validate.
+
+    Returns:
+        Tuple of (script_name, description) tuples.
+    """
+    return _EXAMPLES
+
+
+async def _drain(stream: asyncio.StreamReader, tail: Deque[str]) -> None:
+    """Read ``stream`` line by line, keeping only the last lines in ``tail``."""
+    async for line in stream:
+        tail.append(line.decode("utf-8", errors="replace"))
+
 
+async def run_example(script_path: str, timeout: int = 35) -> Tuple[bool, str, str]:
+    """Run an example script and capture the tail of its output.
 
-def run_example(script_path: str, timeout: int = 35) -> Tuple[bool, str, str]:
-    """Run an example script and capture output.
+    Output is streamed from the pipes while the script runs, so memory stays
+    bounded however much an example prints.
 
     Args:
         script_path: Path to the example script.
         timeout: Maximum time to allow the script to run (seconds).
 
     Returns:
-        Tuple of (success: bool, stdout: str, stderr: str).
+        Tuple of (success: bool, stdout: str, stderr: str), where stdout and
+        stderr hold at most the last OUTPUT_TAIL_LINES lines.
     """
     start_time = time.time()
 
     try:
-        result = subprocess.run(
-            [sys.executable, script_path],
-            timeout=timeout,
-            capture_output=True,
-            text=True,
+        # Examples never read input; DEVNULL also keeps them off the terminal
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable,
+            script_path,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
+    except Exception as e:
+        return False, "", f"Script failed with exception: {e}"
 
+    stdout_tail: Deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+    stderr_tail: Deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(
+                _drain(proc.stdout, stdout_tail),
+                _drain(proc.stderr, stderr_tail),
+                proc.wait(),
+            ),
+            timeout=timeout,
+        )
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
         elapsed = time.time() - start_time
-        success = result.returncode == 0
+        return False, "", f"Script timed out after {elapsed:.1f}s (limit: {timeout}s)"
 
-        return success, result.stdout, result.stderr
+    return proc.returncode == 0, "".join(stdout_tail), "".join(stderr_tail)
 
-    except subprocess.TimeoutExpired:
-        elapsed = time.time() - start_time
-        return False, "", f"Script timed out after {elapsed:.1f}s (limit: {timeout}s)"
-    except Exception as e:
-        elapsed = time.time() - start_time
-        return False, "", f"Script failed with exception: {e}"
 
+@pytest.fixture(scope="session")
+async def example_results() -> Dict[str, Tuple[bool, str, str]]:
+    """Run every example script once, all at the same time.
 
-@pytest.mark.parametrize("script_path,description", get_example_scripts())
-def test_example_runs(script_path: str, description: str):
+    The examples are independent subprocesses, so waiting on them
+    concurrently takes about as long as the slowest one.
+    """
+    scripts = [script_path for script_path, _ in _EXAMPLES]
+    results = await asyncio.gather(*(run_example(path) for path in scripts))
+    return dict(zip(scripts, results))
+
+
+# The examples already run concurrently inside example_results; one xdist
+# group keeps every example test, and so that single batch, on one worker
+EXAMPLE_CASES = [
+    pytest.param(
+        script_path,
+        description,
+        id=Path(script_path).stem,
+        marks=pytest.mark.xdist_group("examples"),
+    )
+    for script_path, description in _EXAMPLES
+]
+
+
+@pytest.mark.parametrize("script_path,description", EXAMPLE_CASES)
+def test_example_runs(example_results, script_path: str, description: str):
     """Test that each example script runs successfully.
 
     This test executes the example script with a timeout and verifies
     that it completes without errors. Examples should complete within
     30 seconds per the design requirements.
     """
-    success, stdout, stderr = run_example(script_path)
+    success, stdout, stderr = example_results[script_path]
 
     if not success:
         pytest.fail(
@@ -108,38 +172,35 @@ def test_all_examples_exist():
         )
 
 
-def test_examples_complete_quickly():
+@pytest.mark.parametrize("script_path,description", EXAMPLE_CASES)
+def test_examples_complete_quickly(example_results, script_path: str, description: str):
     """Verify examples complete within reasonable time."""
-    scripts = get_example_scripts()
+    success, stdout, stderr = example_results[script_path]
 
-    for script_path, description in scripts:
-        success, stdout, stderr = run_example(script_path, timeout=35)
-
-        if not success and "timed out" in stderr:
-            pytest.fail(
-                f"Example '{description}' took too long to complete.\n"
-                f"  Script: {Path(script_path).name}\n"
-                f"  Error: {stderr}\n"
-                f"  Examples should complete within 30 seconds per design requirements."
-            )
+    if not success and "timed out" in stderr:
+        pytest.fail(
+            f"Example '{description}' took too long to complete.\n"
+            f"  Script: {Path(script_path).name}\n"
+            f"  Error: {stderr}\n"
+            f"  Examples should complete within 30 seconds per design requirements."
+        )
 
 
-def test_example_outputs():
+@pytest.mark.parametrize("script_path,description", EXAMPLE_CASES)
+def test_example_outputs(example_results, script_path: str, description: str):
     """Verify examples produce expected output patterns."""
-    scripts = get_example_scripts()
+    success, stdout, stderr = example_results[script_path]
 
-    for script_path, description in scripts:
-        success, stdout, stderr = run_example(script_path)
-
-        if not success:
-            continue
+    if not success:
+        # Failures are reported by test_example_runs
+        return
 
-        script_name = Path(script_path).name
+    script_name = Path(script_path).name
 
-        # Check for expected completion marker
-        if "Example Complete" not in stdout and "Example Complete" not in stderr:
-            pytest.fail(
-                f"Example '{description}' did not produce expected completion marker.\n"
-                f"  Script: {script_name}\n"
-                f"  Expected output to contain 'Example Complete'"
-            )
+    # Check for expected completion marker
+    if "Example Complete" not in stdout and "Example Complete" not in stderr:
+        pytest.fail(
+            f"Example '{description}' did not produce expected completion marker.\n"
+            f"  Script: {script_name}\n"
+            f"  Expected output to contain 'Example Complete'"
+        )